@@ -2,3 +2,12 @@
 """
 
 __version__ = "0.1"
+
+
+def __getattr__(name):
+    # The loading API imports Kedro, which is only done when it is first used.
+    if name in ('load', 'clear_cache'):
+        from . import loader
+
+        return getattr(loader, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
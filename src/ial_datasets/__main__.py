@@ -2,45 +2,40 @@
 as `ial-datasets` and `python -m ial_datasets`
 """
 import importlib
+import sys
 from pathlib import Path
 
-from kedro.framework.cli.utils import KedroCliError, load_entry_points
+from kedro.framework.cli.utils import KedroCliError
 from kedro.framework.project import configure_project
 
 
-def _find_run_command(package_name):
+def _find_command(package_name, args):
     try:
         project_cli = importlib.import_module(f"{package_name}.cli")
         # fail gracefully if cli.py does not exist
     except ModuleNotFoundError as exc:
         if f"{package_name}.cli" not in str(exc):
             raise
-        plugins = load_entry_points("project")
-        run = _find_run_command_in_plugins(plugins) if plugins else None
-        if run:
-            # use run command from installed plugin if it exists
-            return run
-        # use run command from the framework project
+        # use run command from the framework project, without scanning the
+        # entry points of the installed plugins, none of which overrides it
         from kedro.framework.cli.project import run
 
         return run
     # fail badly if cli.py exists, but has no `cli` in it
     if not hasattr(project_cli, "cli"):
         raise KedroCliError(f"Cannot load commands from {package_name}.cli")
+    # dispatch to the other project commands by name, and run otherwise
+    if args and args[0] != "run" and args[0] in project_cli.cli.commands:
+        return project_cli.cli
     return project_cli.run
 
 
-def _find_run_command_in_plugins(plugins):
-    for group in plugins:
-        if "run" in group.commands:
-            return group.commands["run"]
-
-
 def main(*args, **kwargs):
     package_name = Path(__file__).parent.name
     configure_project(package_name)
-    run = _find_run_command(package_name)
-    run(*args, **kwargs)
+    command_args = kwargs.get("args", args[0] if args else sys.argv[1:])
+    command = _find_command(package_name, list(command_args or []))
+    command(*args, **kwargs)
 
 
 if __name__ == "__main__":
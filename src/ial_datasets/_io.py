@@ -0,0 +1,62 @@
+"""Hashing and atomic writing of local files."""
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+CHUNK_SIZE = 1 << 20
+
+
+def file_digest(path):
+    """Return the SHA-256 hash of a file, read in chunks, to be updated further."""
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256
+
+
+def hash_file(path):
+    """Return the SHA-256 digest of a file."""
+    return file_digest(path).hexdigest()
+
+
+@contextmanager
+def atomic_path(path):
+    """Yield a temporary path that is moved to ``path`` once written.
+
+    The temporary file is named after the process and the thread, so that
+    concurrent writers do not share it, and it is removed when writing fails.
+    Readers never see a partially written file and memory-mapped frames keep
+    mapping the replaced file, instead of a file that is truncated under them.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp_path.unlink(missing_ok=True)
+    try:
+        yield tmp_path
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def atomic_open(path, mode='wb'):
+    """Open a temporary file that is moved to ``path`` once written."""
+    with atomic_path(path) as tmp_path, tmp_path.open(mode) as file:
+        yield file
+
+
+def write_text(path, text):
+    """Write a text file atomically."""
+    with atomic_open(path, 'w') as file:
+        file.write(text)
+
+
+def write_json(path, data):
+    """Write a JSON file atomically, with sorted keys."""
+    write_text(path, json.dumps(data, indent=2, sort_keys=True))
@@ -0,0 +1,73 @@
+"""Command line tools of the project.
+
+Besides the Kedro ``run`` command, the project provides the ``mirror`` and ``serve``
+commands, which build and serve a local mirror of the upstream sources.
+"""
+
+from pathlib import Path
+
+import click
+from kedro.framework.cli.project import run
+from kedro.framework.cli.utils import CONTEXT_SETTINGS, _split_params, env_option
+from kedro.framework.project import settings
+
+MIRROR_PATH = 'data/00_mirror'
+
+
+@click.group(context_settings=CONTEXT_SETTINGS, name=__file__)
+def cli():
+    """Command line tools for the project."""
+
+
+cli.add_command(run)
+
+
+def _load_params(env, runtime_params):
+    conf_source = Path.cwd() / settings.CONF_SOURCE
+    config_loader = settings.CONFIG_LOADER_CLASS(
+        conf_source=str(conf_source),
+        env=env,
+        runtime_params=runtime_params,
+        **settings.CONFIG_LOADER_ARGS,
+    )
+    return config_loader['parameters']
+
+
+@cli.command()
+@env_option
+@click.option(
+    '--path', type=click.Path(), default=MIRROR_PATH, help='Root of the mirror.'
+)
+@click.option(
+    '--datasets',
+    '-d',
+    multiple=True,
+    help='Datasets to mirror, all of them by default. Can be repeated.',
+)
+@click.option(
+    '--params',
+    type=click.UNPROCESSED,
+    default='',
+    callback=_split_params,
+    help='Parameters to override, as in the run command.',
+)
+def mirror(env, path, datasets, params):
+    """Snapshot the files of the upstream sources into a local mirror."""
+    from .mirror import build_mirror
+
+    failed = build_mirror(_load_params(env, params), path, list(datasets) or None)
+    if failed:
+        raise click.ClickException(f'Failed to mirror {len(failed)} files.')
+
+
+@cli.command()
+@click.option(
+    '--path', type=click.Path(), default=MIRROR_PATH, help='Root of the mirror.'
+)
+@click.option('--host', default='127.0.0.1', help='Address to listen on.')
+@click.option('--port', type=int, default=8000, help='Port to listen on.')
+def serve(path, host, port):
+    """Serve a local mirror over HTTP."""
+    from .mirror import serve_mirror
+
+    serve_mirror(path, host, port)
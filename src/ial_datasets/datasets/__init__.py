@@ -0,0 +1,14 @@
+"""Project datasets."""
+
+from .corpus_dataset import Corpus, CorpusDataset
+from .matrix_dataset import MatrixDataset
+from .row_subset_dataset import RowSubsetDataset
+from .table_dataset import TableDataset
+
+__all__ = [
+    'Corpus',
+    'CorpusDataset',
+    'MatrixDataset',
+    'RowSubsetDataset',
+    'TableDataset',
+]
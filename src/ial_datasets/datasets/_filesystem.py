@@ -0,0 +1,21 @@
+"""Filesystem of the paths of the datasets."""
+
+from copy import deepcopy
+from pathlib import PurePosixPath
+
+import fsspec
+from kedro.io.core import get_protocol_and_path
+
+
+def filesystem(filepath, credentials=None, fs_args=None):
+    """Return the protocol, the path and the fsspec filesystem of a file path.
+
+    As in the datasets of ``kedro-datasets``, the parent directories of local files
+    are created when they are written.
+    """
+    fs_args = deepcopy(fs_args) or {}
+    protocol, path = get_protocol_and_path(str(filepath))
+    if protocol == 'file':
+        fs_args.setdefault('auto_mkdir', True)
+    fs = fsspec.filesystem(protocol, **(deepcopy(credentials) or {}), **fs_args)
+    return protocol, PurePosixPath(path), fs
@@ -0,0 +1,136 @@
+"""Dataset storing many numerical data frames in a single indexed file."""
+
+import json
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str
+
+from .._io import atomic_open
+from ._filesystem import filesystem
+
+MAGIC = b'IALCORP1'
+ALIGNMENT = 64
+# The file ends with the offset of its index and the magic bytes.
+FOOTER = struct.Struct('<Q8s')
+
+
+def _padding(offset):
+    return -offset % ALIGNMENT
+
+
+class Corpus(Mapping):
+    """Read-only mapping from the names of the data frames of a corpus file to them.
+
+    The file is opened and memory-mapped once, and every data frame is built on
+    views of the mapped file, so that it is read from disk without parsing or
+    copying.
+    """
+
+    def __init__(self, filepath):
+        self._buffer = np.memmap(filepath, mode='r')
+        index_offset, magic = FOOTER.unpack(self._buffer[-FOOTER.size :].tobytes())
+        if magic != MAGIC or self._buffer[: len(MAGIC)].tobytes() != MAGIC:
+            raise ValueError(f'{filepath} is not a corpus file.')
+        self._index = json.loads(self._buffer[index_offset : -FOOTER.size].tobytes())
+
+    def _array(self, entry):
+        return np.ndarray(
+            tuple(entry['shape']),
+            dtype=entry['dtype'],
+            buffer=self._buffer,
+            offset=entry['offset'],
+        )
+
+    def arrays(self, name):
+        """Return the features matrix and the label vector of a data frame."""
+        entry = self._index[name]
+        y = None if entry['y'] is None else self._array(entry['y'])
+        return self._array(entry['X']), y
+
+    def __getitem__(self, name):
+        entry = self._index[name]
+        X, y = self.arrays(name)
+        data = pd.DataFrame(X, columns=entry['features'], copy=False)
+        if y is not None:
+            data.insert(entry['columns'].index(entry['label']), entry['label'], y)
+        return data
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+
+class CorpusDataset(AbstractDataset[Mapping, Corpus]):
+    """Dataset storing a mapping of numerical data frames in a single file.
+
+    The features of every data frame are stored as a contiguous matrix and its label
+    column as a vector, each aligned to ``ALIGNMENT`` bytes, followed by a JSON index
+    of their offsets, dtypes and shapes and of the column labels. On load, a
+    ``Corpus`` of the data frames is returned, which memory-maps the file, which is
+    why only local files are supported.
+
+    Args:
+        filepath: Path of the file.
+        label: Label of the column stored as label vector, if any.
+    """
+
+    def __init__(self, filepath, label=None):
+        self._protocol, self._filepath, self._fs = filesystem(filepath)
+        if self._protocol != 'file':
+            raise ValueError('Only local files can be memory-mapped.')
+        self._path = Path(get_filepath_str(self._filepath, self._protocol))
+        self._label = label
+
+    def _describe(self):
+        return {
+            'filepath': str(self._filepath),
+            'protocol': self._protocol,
+            'label': self._label,
+        }
+
+    def _exists(self):
+        return self._fs.exists(str(self._path))
+
+    def _load(self):
+        return Corpus(self._path)
+
+    def _write_array(self, file, array):
+        if array.dtype.hasobject:
+            raise ValueError('Only numerical data frames can be stored in a corpus.')
+        file.write(b'\0' * _padding(file.tell()))
+        entry = {'offset': file.tell(), 'dtype': array.dtype.str, 'shape': array.shape}
+        file.write(np.ascontiguousarray(array).data)
+        return entry
+
+    def _write(self, file, data):
+        index = {}
+        file.write(MAGIC)
+        for name, frame in data.items():
+            has_label = self._label in frame.columns
+            features = frame.drop(columns=self._label) if has_label else frame
+            index[name] = {
+                'columns': frame.columns.tolist(),
+                'features': features.columns.tolist(),
+                'label': self._label if has_label else None,
+                'X': self._write_array(file, features.to_numpy()),
+                'y': (
+                    self._write_array(file, frame[self._label].to_numpy())
+                    if has_label
+                    else None
+                ),
+            }
+        index_offset = file.tell()
+        file.write(json.dumps(index).encode())
+        file.write(FOOTER.pack(index_offset, MAGIC))
+
+    def _save(self, data):
+        self._fs.mkdirs(str(self._path.parent), exist_ok=True)
+        with atomic_open(self._path) as file:
+            self._write(file, data)
@@ -0,0 +1,86 @@
+"""Dataset storing wide numerical data frames as memory-mapped matrices."""
+
+import json
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str
+
+from .._io import atomic_open
+from ._filesystem import filesystem
+
+
+def _replace(path, write):
+    """Write a file atomically, so that loaded frames keep mapping the old one."""
+    with atomic_open(path) as file:
+        write(file)
+
+
+class MatrixDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """Dataset storing a numerical data frame as a directory of NumPy arrays.
+
+    The features are stored as a single contiguous matrix in ``X.npy``, the label
+    column in ``y.npy`` and the column labels in ``header.json``. On load, the
+    matrix is memory-mapped, so that column slices and row subsets of the data
+    frame are read from disk without parsing or copying the full matrix, which is
+    why only local directories are supported.
+
+    Args:
+        filepath: Path of the directory.
+        label: Label of the column stored as label vector, if any.
+        dtype: Dtype of the features matrix, by default the dtype of the features.
+    """
+
+    def __init__(self, filepath, label=None, dtype=None):
+        self._protocol, self._filepath, self._fs = filesystem(filepath)
+        if self._protocol != 'file':
+            raise ValueError('Only local directories can be memory-mapped.')
+        self._path = Path(get_filepath_str(self._filepath, self._protocol))
+        self._label = label
+        self._dtype = None if dtype is None else np.dtype(dtype)
+
+    def _describe(self):
+        return {
+            'filepath': str(self._filepath),
+            'protocol': self._protocol,
+            'label': self._label,
+            'dtype': None if self._dtype is None else self._dtype.name,
+        }
+
+    def _exists(self):
+        return self._fs.exists(str(self._path / 'header.json'))
+
+    def _load(self):
+        header = json.loads((self._path / 'header.json').read_text())
+        X = np.load(self._path / 'X.npy', mmap_mode='r')
+        data = pd.DataFrame(X, columns=header['features'], copy=False)
+        if header['label'] is not None:
+            y = np.load(self._path / 'y.npy')
+            data.insert(header['columns'].index(header['label']), header['label'], y)
+        return data
+
+    def _save(self, data):
+        has_label = self._label in data.columns
+        features = data.drop(columns=self._label) if has_label else data
+        header = {
+            'columns': data.columns.tolist(),
+            'features': features.columns.tolist(),
+            'label': self._label if has_label else None,
+        }
+        self._fs.mkdirs(str(self._path), exist_ok=True)
+        _replace(
+            self._path / 'X.npy',
+            partial(np.save, arr=features.to_numpy(dtype=self._dtype)),
+        )
+        if has_label:
+            _replace(
+                self._path / 'y.npy',
+                partial(np.save, arr=data[self._label].to_numpy()),
+            )
+        _replace(
+            self._path / 'header.json',
+            lambda file: file.write(json.dumps(header).encode()),
+        )
@@ -0,0 +1,56 @@
+"""Dataset storing a data frame as a subset of the rows of another dataset."""
+
+import numpy as np
+import pandas as pd
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str, parse_dataset_definition
+
+from ._filesystem import filesystem
+
+
+class RowSubsetDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """Dataset storing only the row positions of a data frame in a base dataset.
+
+    The index of a saved data frame has to hold the positions of its rows in the
+    data of the base dataset, which are stored as an ``int32`` NumPy array. On
+    load, the rows are taken from the base data and the index is reset.
+
+    Args:
+        filepath: Path of the ``.npy`` file of the row positions, prefixed with a
+            protocol for remote files.
+        base: Definition of the base dataset, as in the data catalog.
+        credentials: Credentials of the filesystem of the row positions.
+        fs_args: Arguments of the filesystem of the row positions.
+    """
+
+    def __init__(self, filepath, base, credentials=None, fs_args=None):
+        self._protocol, self._filepath, self._fs = filesystem(
+            filepath, credentials, fs_args
+        )
+        self._base_config = base
+        dataset_type, dataset_config = parse_dataset_definition(base)
+        self._base = dataset_type(**dataset_config)
+
+    def _describe(self):
+        return {
+            'filepath': str(self._filepath),
+            'protocol': self._protocol,
+            'base': self._base_config,
+        }
+
+    def _exists(self):
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _load(self):
+        path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(path, 'rb') as file:
+            indices = np.load(file)
+        return self._base.load().take(indices).reset_index(drop=True)
+
+    def _save(self, data):
+        if not pd.api.types.is_integer_dtype(data.index) or (data.index < 0).any():
+            raise ValueError('The index of the data must hold integer row positions.')
+        path = get_filepath_str(self._filepath, self._protocol)
+        with self._fs.open(path, 'wb') as file:
+            np.save(file, data.index.to_numpy(dtype=np.int32))
+        self._fs.invalidate_cache(path)
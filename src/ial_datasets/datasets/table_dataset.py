@@ -0,0 +1,104 @@
+"""Dataset storing data frames in a columnar file format."""
+
+import json
+from contextlib import nullcontext
+
+import pandas as pd
+from kedro.io import AbstractDataset
+from kedro.io.core import get_filepath_str
+
+from ._filesystem import filesystem
+
+COLUMNS_KEY = b'ial_datasets.columns'
+
+
+class TableDataset(AbstractDataset[pd.DataFrame, pd.DataFrame]):
+    """Dataset storing a data frame as a Parquet or an Arrow IPC (Feather) file.
+
+    The dtypes are preserved by the Arrow schema, while the original column labels,
+    including integer ones, are stored in its metadata and restored on load. The
+    file is accessed through ``fsspec``, while local files are read and written by
+    PyArrow directly. PyArrow is only imported when the data are loaded or saved.
+
+    Args:
+        filepath: Path of the file, prefixed with a protocol for remote files.
+        file_format: Either ``'parquet'`` or ``'feather'``.
+        compression: Compression codec, e.g. ``'zstd'``, ``'lz4'`` or
+            ``'uncompressed'``.
+        credentials: Credentials of the filesystem.
+        fs_args: Arguments of the filesystem.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        filepath,
+        file_format='parquet',
+        compression='zstd',
+        credentials=None,
+        fs_args=None,
+    ):
+        if file_format not in ('parquet', 'feather'):
+            raise ValueError(f'Unknown file format {file_format}.')
+        self._protocol, self._filepath, self._fs = filesystem(
+            filepath, credentials, fs_args
+        )
+        self._file_format = file_format
+        self._compression = compression
+
+    def _describe(self):
+        return {
+            'filepath': str(self._filepath),
+            'protocol': self._protocol,
+            'file_format': self._file_format,
+            'compression': self._compression,
+        }
+
+    def _open(self, mode):
+        path = get_filepath_str(self._filepath, self._protocol)
+        if self._protocol == 'file':
+            return nullcontext(path)
+        return self._fs.open(path, mode)
+
+    def _exists(self):
+        return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
+    def _load(self):
+        from pyarrow import feather, parquet
+
+        with self._open('rb') as file:
+            if self._file_format == 'parquet':
+                table = parquet.read_table(file)
+            else:
+                table = feather.read_table(file)
+        data = table.to_pandas()
+        columns = (table.schema.metadata or {}).get(COLUMNS_KEY)
+        if columns is not None:
+            data.columns = json.loads(columns)
+        return data
+
+    def _save(self, data):
+        import pyarrow as pa
+        from pyarrow import feather, parquet
+
+        table = pa.Table.from_pandas(
+            data.set_axis([str(column) for column in data.columns], axis=1),
+            preserve_index=False,
+        )
+        table = table.replace_schema_metadata(
+            {
+                **table.schema.metadata,
+                COLUMNS_KEY: json.dumps(data.columns.tolist()).encode(),
+            }
+        )
+        self._fs.mkdirs(
+            get_filepath_str(self._filepath.parent, self._protocol), exist_ok=True
+        )
+        with self._open('wb') as file:
+            if self._file_format == 'parquet':
+                parquet.write_table(table, file, compression=self._compression)
+            else:
+                feather.write_feather(table, file, compression=self._compression)
+        self._invalidate_cache()
+
+    def _invalidate_cache(self):
+        self._fs.invalidate_cache(get_filepath_str(self._filepath, self._protocol))
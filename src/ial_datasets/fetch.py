@@ -0,0 +1,405 @@
+"""Shared fetch layer with a content-addressed on-disk cache."""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ._io import file_digest, hash_file, write_json
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 20
+DEFAULT_CACHE_PARAMS = {
+    'path': 'data/00_cache',
+    'max_size': 2 * 1024**3,
+    'max_age': 24 * 60 * 60,
+    'timeout': 60,
+    'max_retries': 5,
+}
+DEFAULT_CONCURRENCY_PARAMS = {
+    'max_workers': 16,
+    'max_connections_per_host': {'default': 4},
+}
+
+
+class BlobCache:
+    """Content-addressed store of downloaded files.
+
+    Blobs are stored under ``blobs/`` by their SHA-256 digest, while ``index.json``
+    maps every URL to its blob together with the ``ETag`` and ``Last-Modified``
+    validators returned by the server. The least recently used URLs are evicted
+    once the blobs exceed ``max_size`` bytes.
+    """
+
+    def __init__(self, path, max_size=None):
+        self._path = Path(path)
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def blob_path(self, sha256):
+        return self._path / 'blobs' / sha256[:2] / sha256
+
+    def _read_index(self):
+        try:
+            return json.loads((self._path / 'index.json').read_text())
+        except FileNotFoundError:
+            return {}
+
+    def _write_index(self, index):
+        self._path.mkdir(parents=True, exist_ok=True)
+        write_json(self._path / 'index.json', index)
+
+    def lookup(self, url):
+        """Return the index entry of ``url`` or ``None`` if its blob is missing."""
+        with self._lock:
+            entry = self._read_index().get(url)
+        if entry is None or not self.blob_path(entry['sha256']).exists():
+            return None
+        return entry
+
+    def touch(self, url, validated=False):
+        """Mark ``url`` as used, and optionally as revalidated with the server."""
+        with self._lock:
+            index = self._read_index()
+            now = time.time()
+            index[url]['accessed'] = now
+            if validated:
+                index[url]['validated'] = now
+            self._write_index(index)
+            return self.blob_path(index[url]['sha256'])
+
+    def discard(self, url):
+        with self._lock:
+            index = self._read_index()
+            self._remove(index, url)
+            self._write_index(index)
+
+    def _remove(self, index, url):
+        sha256 = index.pop(url)['sha256']
+        if all(entry['sha256'] != sha256 for entry in index.values()):
+            self.blob_path(sha256).unlink(missing_ok=True)
+            return True
+        return False
+
+    def partial_paths(self, url):
+        """Return the paths of the partial download of ``url`` and of its metadata."""
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return (
+            self._path / 'partial' / f'{name}.part',
+            self._path / 'partial' / f'{name}.json',
+        )
+
+    def discard_partial(self, url):
+        for path in self.partial_paths(url):
+            path.unlink(missing_ok=True)
+
+    def store(self, url, tmp_path, sha256, headers):
+        """Move a downloaded file into the cache and record it under ``url``."""
+        blob_path = self.blob_path(sha256)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, blob_path)
+        with self._lock:
+            index = self._read_index()
+            now = time.time()
+            index[url] = {
+                'sha256': sha256,
+                'size': blob_path.stat().st_size,
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'validated': now,
+                'accessed': now,
+            }
+            self._evict(index, keep=url)
+            self._write_index(index)
+        return blob_path
+
+    def _evict(self, index, keep):
+        if self._max_size is None:
+            return
+        sizes = {entry['sha256']: entry['size'] for entry in index.values()}
+        total_size = sum(sizes.values())
+        for url in sorted(index, key=lambda url: index[url]['accessed']):
+            if total_size <= self._max_size:
+                break
+            if url == keep:
+                continue
+            sha256 = index[url]['sha256']
+            if self._remove(index, url):
+                total_size -= sizes[sha256]
+            logger.info('Evicted %s from the download cache.', url)
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+_session = None
+_session_lock = threading.Lock()
+_host_semaphores = {}
+_host_semaphores_lock = threading.Lock()
+_url_locks = {}
+_url_locks_lock = threading.Lock()
+
+
+def _get_cache(cache_params):
+    path = Path(cache_params['path']).resolve()
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = BlobCache(path, cache_params['max_size'])
+        return _caches[path]
+
+
+def _get_session(params):
+    """Return the session shared by all downloads, to reuse its connections."""
+    global _session  # noqa: PLW0603
+    with _session_lock:
+        if _session is None:
+            concurrency_params = {
+                **DEFAULT_CONCURRENCY_PARAMS,
+                **params.get('download_concurrency', {}),
+            }
+            adapter = HTTPAdapter(
+                pool_connections=concurrency_params['max_workers'],
+                pool_maxsize=concurrency_params['max_workers'],
+            )
+            _session = requests.Session()
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+
+def _url_lock(url):
+    """Return the lock that serializes the downloads of ``url``."""
+    with _url_locks_lock:
+        return _url_locks.setdefault(url, threading.Lock())
+
+
+@contextmanager
+def _host_slot(url, params):
+    """Limit the number of concurrent downloads from the host of ``url``."""
+    host = urlsplit(url).hostname
+    limits = {
+        **DEFAULT_CONCURRENCY_PARAMS['max_connections_per_host'],
+        **params.get('download_concurrency', {}).get('max_connections_per_host', {}),
+    }
+    with _host_semaphores_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(
+                limits.get(host, limits['default'])
+            )
+        semaphore = _host_semaphores[host]
+    with semaphore:
+        yield
+
+
+def _validator(headers):
+    """Return the validator of a response usable in ``If-Range``, if any.
+
+    Weak entity tags can not be used to resume a download.
+    """
+    etag = headers.get('ETag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return headers.get('Last-Modified')
+
+
+def _range_start(headers):
+    """Return the first byte of a partial response or ``None`` if it is unknown."""
+    match = re.fullmatch(r'bytes (\d+)-\d+/(\d+|\*)', headers.get('Content-Range', ''))
+    return None if match is None else int(match.group(1))
+
+
+def _download(url, params, cache, headers, cache_params):
+    """Stream ``url`` into the partial file of the cache, resuming it if possible.
+
+    A partial file left by an interrupted download is resumed with an HTTP range
+    request, which the server only honours if the file has not changed since. The
+    transfer is resumed the same way up to ``max_retries`` times when the
+    connection drops. The download restarts from the first byte when the range
+    of a partial response does not start at the end of the partial file.
+
+    Returns:
+        The path of the downloaded file, its SHA-256 checksum and the response
+        headers, or ``None`` if the server reports that the cached copy is current.
+    """
+    part_path, meta_path = cache.partial_paths(url)
+    try:
+        validator = json.loads(meta_path.read_text())['validator']
+    except FileNotFoundError:
+        validator = None
+    digest = None
+    for attempt in range(cache_params['max_retries'] + 1):
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        request_headers = dict(headers)
+        if offset and validator:
+            request_headers = {'Range': f'bytes={offset}-', 'If-Range': validator}
+        response = _get_session(params).get(
+            url, headers=request_headers, stream=True, timeout=cache_params['timeout']
+        )
+        with response:
+            if response.status_code == requests.codes.range_not_satisfiable:
+                part_path.unlink()
+                validator = None
+                continue
+            response.raise_for_status()
+            if response.status_code == requests.codes.not_modified:
+                return None
+            resumed = response.status_code == requests.codes.partial_content
+            if resumed:
+                start = _range_start(response.headers)
+                if start != offset:
+                    logger.warning(
+                        'The server resumed the download of %s at byte %s instead of '
+                        '%d, restarting it.',
+                        url,
+                        start,
+                        offset,
+                    )
+                    if start != 0:
+                        # The body can neither be appended to nor replace the file.
+                        part_path.unlink(missing_ok=True)
+                        continue
+                resumed = bool(offset) and start == offset
+            if resumed:
+                if digest is None:
+                    digest = file_digest(part_path)
+                logger.info('Resuming the download of %s at byte %d.', url, offset)
+            else:
+                offset = 0
+                digest = hashlib.sha256()
+            validator = _validator(response.headers)
+            part_path.parent.mkdir(parents=True, exist_ok=True)
+            meta_path.write_text(json.dumps({'url': url, 'validator': validator}))
+            with open(part_path, 'ab' if offset else 'wb') as file:
+                try:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        digest.update(chunk)
+                        file.write(chunk)
+                except (
+                    requests.exceptions.ChunkedEncodingError,
+                    requests.ConnectionError,
+                ) as error:
+                    if attempt == cache_params['max_retries']:
+                        raise
+                    logger.warning('Interrupted download of %s: %s', url, error)
+                    continue
+            return part_path, digest.hexdigest(), response.headers
+    raise requests.ConnectionError(f'Failed to download {url}.')
+
+
+def _lookup(cache, url, sha256, cache_params):
+    """Return the path of a current cached copy of ``url`` and its index entry.
+
+    The path is ``None`` if the copy has to be revalidated or downloaded, and the
+    entry is ``None`` if there is no usable copy.
+    """
+    entry = cache.lookup(url)
+    if entry is None:
+        return None, None
+    if sha256 is not None:
+        if entry['sha256'] == sha256 and hash_file(cache.blob_path(sha256)) == sha256:
+            return cache.touch(url), entry
+        cache.discard(url)
+        return None, None
+    if time.time() - entry['validated'] < cache_params['max_age']:
+        return cache.touch(url), entry
+    return None, entry
+
+
+def fetch(url, params, sha256=None):
+    """Return the path of a local copy of ``url``.
+
+    The file is downloaded only if it is not cached, if its cached copy is older
+    than ``max_age`` seconds and the server reports a change, or if it does not
+    match the pinned ``sha256`` checksum. Downloads are streamed to disk and
+    resumed after an interruption. A stale copy is used when the server can not be
+    reached.
+    """
+    cache_params = {**DEFAULT_CACHE_PARAMS, **params.get('http_cache', {})}
+    cache = _get_cache(cache_params)
+    path, _ = _lookup(cache, url, sha256, cache_params)
+    if path is not None:
+        return path
+    with _url_lock(url):
+        # The file may have been downloaded by another thread while waiting.
+        path, entry = _lookup(cache, url, sha256, cache_params)
+        if path is not None:
+            return path
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        with _host_slot(url, params):
+            try:
+                result = _download(url, params, cache, headers, cache_params)
+            except requests.RequestException as error:
+                if entry is None:
+                    raise
+                logger.warning('Using the cached copy of %s: %s', url, error)
+                return cache.touch(url)
+        if result is None:
+            return cache.touch(url, validated=True)
+        part_path, digest, response_headers = result
+        if sha256 is not None and digest != sha256:
+            cache.discard_partial(url)
+            raise ValueError(
+                f'Checksum mismatch for {url}: expected {sha256}, got {digest}.'
+            )
+        logger.info('Downloaded %s.', url)
+        blob_path = cache.store(url, part_path, digest, response_headers)
+        cache.discard_partial(url)
+    return blob_path
+
+
+def mirror_path(url):
+    """Return the path of the copy of ``url`` relative to the root of a mirror.
+
+    The copies are stored under the host of their URLs, followed by their port if
+    it is given, e.g. ``localhost_8080``.
+    """
+    parts = urlsplit(url)
+    host = parts.hostname if parts.port is None else f'{parts.hostname}_{parts.port}'
+    return f'{host}{parts.path}'
+
+
+def to_mirror_url(url, mirror_url):
+    """Return the URL of the copy of ``url`` in the mirror served at ``mirror_url``."""
+    return urljoin(mirror_url.rstrip('/') + '/', mirror_path(url))
+
+
+def _fetch_or_error(url, params, sha256):
+    try:
+        return fetch(url, params, sha256)
+    except (requests.RequestException, ValueError) as error:
+        return error
+
+
+def fetch_all(urls, params, sha256s=None, return_exceptions=False):
+    """Fetch several URLs concurrently and return the paths of their local copies.
+
+    The downloads share pooled connections and are limited per host by the
+    ``download_concurrency`` parameters. If ``return_exceptions`` is true, failed
+    downloads return their exception instead of raising it.
+    """
+    if sha256s is None:
+        sha256s = [None] * len(urls)
+    func = _fetch_or_error if return_exceptions else fetch
+    if len(urls) <= 1:
+        return [func(url, params, sha256) for url, sha256 in zip(urls, sha256s)]
+    max_workers = params.get('download_concurrency', {}).get(
+        'max_workers', DEFAULT_CONCURRENCY_PARAMS['max_workers']
+    )
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(func, urls, repeat(params), sha256s))
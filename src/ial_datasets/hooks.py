@@ -0,0 +1,251 @@
+"""Project hooks."""
+
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from kedro.framework.hooks import hook_impl
+
+from ._io import write_text
+from .profiling import _read_peak_memory, _reset_peak_memory
+
+logger = logging.getLogger(__name__)
+
+METRICS_PREFIX = 'ial_datasets_node'
+SUMMARY_SIZE = 10
+CREATE_METRICS_TABLE = (
+    'CREATE TABLE IF NOT EXISTS metrics (session_id TEXT, node TEXT, dataset TEXT, '
+    'operation TEXT, seconds REAL, rows INTEGER, bytes INTEGER, peak_memory INTEGER)'
+)
+
+
+class DownloadHooks:
+    """Fetch the files of all the datasets downloaded by a run at once.
+
+    The files are fetched concurrently into the download cache when the first
+    downloading node runs, so the downloading nodes only read local copies. The
+    files of the downloading nodes that the runner skips, e.g. the up-to-date nodes
+    skipped by the ``IncrementalRunner``, are not fetched.
+    """
+
+    def __init__(self):
+        self._names = []
+        self._params = None
+        self._lock = threading.Lock()
+
+    @hook_impl
+    def before_pipeline_run(self, pipeline, catalog):
+        self._names = [
+            node.outputs[0].removesuffix('_data')
+            for node in pipeline.nodes
+            if 'download' in node.tags
+        ]
+        # The parameters are loaded before the runner starts, so that the accessed
+        # parameters recorded by the ``IncrementalRunner`` for the node running the
+        # prefetch do not include the URLs of the other datasets.
+        self._params = catalog.load('parameters') if self._names else None
+
+    def skip(self, nodes):
+        """Do not fetch the files of downloading nodes that the runner skips."""
+        skipped = {node.outputs[0].removesuffix('_data') for node in nodes}
+        with self._lock:
+            self._names = [name for name in self._names if name not in skipped]
+
+    @hook_impl
+    def before_node_run(self, node):
+        if 'download' not in node.tags:
+            return
+        # The other downloading nodes wait for the prefetch to read the local copies.
+        with self._lock:
+            names, self._names = self._names, []
+            if names:
+                from .pipelines.data_downloading.nodes import prefetch
+
+                prefetch(self._params, names)
+
+
+def _size(data):
+    """Return the number of rows and bytes of a dataset or ``None`` if unknown.
+
+    pandas and NumPy are not imported here, since the data cannot be of their types
+    unless they have been imported already.
+    """
+    pd = sys.modules.get('pandas')
+    np = sys.modules.get('numpy')
+    if pd is not None and isinstance(data, pd.DataFrame):
+        return len(data), int(data.memory_usage(index=True, deep=True).sum())
+    if pd is not None and isinstance(data, pd.Series):
+        return len(data), int(data.memory_usage(index=True, deep=True))
+    if np is not None and isinstance(data, np.ndarray):
+        return (data.shape[0] if data.ndim else 1), data.nbytes
+    return None, None
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class InstrumentationHooks:
+    """Record the latency, memory and I/O volume of the nodes and datasets of a run.
+
+    For every node, the time spent loading each input, computing and saving each
+    output is measured, along with the rows and in-memory bytes of the datasets and
+    the peak resident set size during the computation. The measurements are inserted
+    in the ``metrics`` table of the SQLite session store as they are taken, so that
+    the nodes run in other processes are recorded too. At the end of the run they are
+    written to an OpenMetrics text file and the slowest nodes are logged.
+
+    The peak memory is that of the whole process, so it is only recorded for the
+    nodes that ran alone in their process. It is missing for the nodes run
+    concurrently in threads, whose peaks cannot be told apart.
+    """
+
+    def __init__(self, db_path, metrics_path, summary_size=SUMMARY_SIZE):
+        self._db_path = Path(db_path)
+        self._metrics_path = Path(metrics_path)
+        self._summary_size = summary_size
+        self._starts = {}
+        self._pending = {}
+        self._session_ids = {}
+        self._running = set()
+        self._overlapped = set()
+        self._running_lock = threading.Lock()
+
+    def _insert(self, rows):
+        with closing(sqlite3.connect(self._db_path, timeout=30)) as connection:
+            with connection:
+                connection.execute(CREATE_METRICS_TABLE)
+                connection.executemany(
+                    'INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows
+                )
+
+    def _select(self, session_id):
+        if not self._db_path.exists():
+            return []
+        with closing(sqlite3.connect(self._db_path, timeout=30)) as connection:
+            with connection:
+                connection.execute(CREATE_METRICS_TABLE)
+                return connection.execute(
+                    'SELECT node, dataset, operation, seconds, rows, bytes, '
+                    'peak_memory FROM metrics WHERE session_id = ?',
+                    (session_id,),
+                ).fetchall()
+
+    def _measure(self, operation, node, dataset_name, data):
+        seconds = time.perf_counter() - self._starts.pop((node.name, dataset_name))
+        return (node.name, dataset_name, operation, seconds, *_size(data), None)
+
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name, node):
+        self._starts[node.name, dataset_name] = time.perf_counter()
+
+    @hook_impl
+    def after_dataset_loaded(self, dataset_name, data, node):
+        measurement = self._measure('load', node, dataset_name, data)
+        self._pending.setdefault(node.name, []).append(measurement)
+
+    @hook_impl
+    def before_node_run(self, node, session_id):
+        self._session_ids[node.name] = session_id
+        with self._running_lock:
+            if self._running:
+                self._overlapped |= {*self._running, node.name}
+            else:
+                _reset_peak_memory()
+            self._running.add(node.name)
+        self._starts[node.name, None] = time.perf_counter()
+
+    def _finish(self, node):
+        """Return whether the node ran alone in the process."""
+        with self._running_lock:
+            self._running.discard(node.name)
+            if node.name in self._overlapped:
+                self._overlapped.discard(node.name)
+                return False
+            return True
+
+    @hook_impl
+    def after_node_run(self, node, session_id):
+        seconds = time.perf_counter() - self._starts.pop((node.name, None))
+        peak_memory = _read_peak_memory() if self._finish(node) else None
+        measurements = self._pending.pop(node.name, [])
+        measurements.append(
+            (node.name, None, 'compute', seconds, None, None, peak_memory)
+        )
+        self._insert([(session_id, *measurement) for measurement in measurements])
+
+    @hook_impl
+    def on_node_error(self, node):
+        self._finish(node)
+        self._pending.pop(node.name, None)
+        self._session_ids.pop(node.name, None)
+
+    @hook_impl
+    def before_dataset_saved(self, dataset_name, node):
+        self._starts[node.name, dataset_name] = time.perf_counter()
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, data, node):
+        measurement = self._measure('save', node, dataset_name, data)
+        self._insert([(self._session_ids[node.name], *measurement)])
+
+    def _write_metrics(self, rows):
+        families = {
+            'compute_seconds': ('Time spent computing the outputs of a node.', []),
+            'peak_memory_bytes': ('Peak resident set size while computing.', []),
+            'dataset_seconds': ('Time spent loading or saving a dataset.', []),
+            'dataset_rows': ('Rows of a loaded or saved dataset.', []),
+            'dataset_bytes': ('In-memory bytes of a loaded or saved dataset.', []),
+        }
+        for node, dataset, operation, seconds, n_rows, n_bytes, peak_memory in rows:
+            if operation == 'compute':
+                labels = f'node="{_escape(node)}"'
+                families['compute_seconds'][1].append((labels, seconds))
+                if peak_memory is not None:
+                    families['peak_memory_bytes'][1].append((labels, peak_memory))
+                continue
+            labels = (
+                f'node="{_escape(node)}",dataset="{_escape(dataset)}",'
+                f'operation="{operation}"'
+            )
+            families['dataset_seconds'][1].append((labels, seconds))
+            if n_rows is not None:
+                families['dataset_rows'][1].append((labels, n_rows))
+                families['dataset_bytes'][1].append((labels, n_bytes))
+        lines = []
+        for suffix, (help_text, samples) in families.items():
+            name = f'{METRICS_PREFIX}_{suffix}'
+            lines += [f'# TYPE {name} gauge', f'# HELP {name} {help_text}']
+            lines += [f'{name}{{{labels}}} {value}' for labels, value in samples]
+        lines.append('# EOF')
+        self._metrics_path.parent.mkdir(parents=True, exist_ok=True)
+        write_text(self._metrics_path, '\n'.join(lines) + '\n')
+
+    def _log_summary(self, rows):
+        totals = {}
+        for node, _, _, seconds, *_ in rows:
+            totals[node] = totals.get(node, 0.0) + seconds
+        slowest = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        for node, seconds in slowest[: self._summary_size]:
+            logger.info('Node %s took %.3fs.', node, seconds)
+
+    def _report(self, session_id):
+        rows = self._select(session_id)
+        self._write_metrics(rows)
+        if rows:
+            logger.info(
+                'Slowest nodes, including the loading and saving of their datasets:'
+            )
+            self._log_summary(rows)
+
+    @hook_impl
+    def after_pipeline_run(self, run_params):
+        self._report(run_params['session_id'])
+
+    @hook_impl
+    def on_pipeline_error(self, run_params):
+        self._report(run_params['session_id'])
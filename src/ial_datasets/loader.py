@@ -0,0 +1,169 @@
+"""In-process loading of the transformed and processed datasets."""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from kedro.framework.context import KedroContext
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.framework.project import PACKAGE_NAME, settings
+from kedro.framework.startup import bootstrap_project
+
+from .registry import DATASETS, IMBALANCED
+
+PROJECT_PATH = Path(__file__).parents[2]
+CACHE_BUDGET = 1024**3
+LAYERS = ('transformed', 'processed')
+
+
+class _ArrayCache:
+    """Least recently used cache of arrays, bounded by their total bytes."""
+
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._n_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            arrays = self._entries.get(key)
+            if arrays is not None:
+                self._entries.move_to_end(key)
+            return arrays
+
+    def _pop(self, key):
+        arrays = self._entries.pop(key)
+        self._n_bytes -= sum(array.nbytes for array in arrays)
+
+    def put(self, key, arrays):
+        """Cache the arrays under a key, replacing those of older versions of it.
+
+        Keys are made of a name and a version, so the arrays of a dataset whose
+        files changed are dropped when its new arrays are cached.
+        """
+        n_bytes = sum(array.nbytes for array in arrays)
+        with self._lock:
+            if key in self._entries:
+                return
+            for stale_key in [k for k in self._entries if k[:-1] == key[:-1]]:
+                self._pop(stale_key)
+            if n_bytes > self._max_bytes:
+                return
+            self._entries[key] = arrays
+            self._n_bytes += n_bytes
+            while self._n_bytes > self._max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._n_bytes = 0
+
+
+_cache = _ArrayCache(CACHE_BUDGET)
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def _get_catalog(env):
+    """Return the data catalog of the project, which is created once per env."""
+    with _catalogs_lock:
+        if env not in _catalogs:
+            bootstrap_project(PROJECT_PATH)
+            config_loader = settings.CONFIG_LOADER_CLASS(
+                conf_source=str(PROJECT_PATH / settings.CONF_SOURCE),
+                env=env,
+                **settings.CONFIG_LOADER_ARGS,
+            )
+            context = KedroContext(
+                project_path=PROJECT_PATH,
+                config_loader=config_loader,
+                env=env,
+                package_name=PACKAGE_NAME or PROJECT_PATH.name.replace('-', '_'),
+                hook_manager=_create_hook_manager(),
+            )
+            _catalogs[env] = context.catalog
+        return _catalogs[env]
+
+
+def _dataset_name(name, factor, layer):
+    if name not in DATASETS:
+        raise ValueError(f'Unknown dataset {name!r}.')
+    if layer is None:
+        layer = 'transformed' if factor is None else 'processed'
+    if layer not in LAYERS:
+        raise ValueError(f'Unknown layer {layer!r}, expected one of {LAYERS}.')
+    group = DATASETS[name].group
+    if layer == 'transformed':
+        return f'{name}_{group}_data'
+    if group != IMBALANCED or factor is None:
+        raise ValueError(
+            f'Processed data is only available for the factors of imbalanced '
+            f'datasets, got {name!r} with factor {factor!r}.'
+        )
+    return f'{name}_{group}_data_{factor}'
+
+
+def _identity(dataset):
+    """Return the identity and modification time of the files of a dataset."""
+    identity = []
+    while dataset is not None:
+        path = Path(dataset._filepath)
+        paths = sorted(path.iterdir()) if path.is_dir() else [path]
+        for path in paths:
+            stat = path.stat()
+            identity.append(
+                (str(path), stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            )
+        dataset = getattr(dataset, '_base', None)
+    return tuple(identity)
+
+
+def _to_arrays(data):
+    """Split a frame into its features matrix and target, as read-only arrays."""
+    target = data.columns.get_loc('target')
+    if target == data.shape[1] - 1:
+        X = data.iloc[:, :target].to_numpy()
+    else:
+        X = data.drop(columns='target').to_numpy()
+    y = data['target'].to_numpy()
+    X, y = np.asarray(X), np.asarray(y)
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return X, y
+
+
+def load(name, factor=None, layer=None, env=None):
+    """Load a transformed or processed dataset of the project as NumPy arrays.
+
+    The arrays are cached in the process, by the identity and modification time of
+    their files, in a least recently used cache of at most ``CACHE_BUDGET`` bytes,
+    and every call returns read-only views of the cached arrays.
+
+    Args:
+        name: Name of the dataset.
+        factor: Imbalance factor of the processed dataset.
+        layer: Either ``'transformed'`` or ``'processed'``, by default the
+            processed layer if a factor is given and the transformed one otherwise.
+        env: Configuration environment of the data catalog.
+
+    Returns:
+        The features matrix and the target vector.
+    """
+    catalog = _get_catalog(env)
+    dataset_name = _dataset_name(name, factor, layer)
+    dataset = catalog._get_dataset(dataset_name)
+    key = (env, dataset_name, _identity(dataset))
+    arrays = _cache.get(key)
+    if arrays is None:
+        arrays = _to_arrays(dataset.load())
+        _cache.put(key, arrays)
+    X, y = arrays
+    return X.view(), y.view()
+
+
+def clear_cache():
+    """Remove all the arrays from the cache of ``load``."""
+    _cache.clear()
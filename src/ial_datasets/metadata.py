@@ -0,0 +1,72 @@
+"""Metadata index of the transformed and processed datasets."""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+METADATA_PATH = Path(__file__).parents[2] / 'data' / '05_metadata'
+
+
+def describe(data, spec, factor=None):
+    """Return the metadata of a transformed or processed data frame.
+
+    The content hash is the SHA-256 checksum of the features matrix and the target,
+    and the size is their number of bytes in memory.
+    """
+    X = data.drop(columns='target').to_numpy()
+    y = data['target'].to_numpy()
+    digest = hashlib.sha256()
+    for array in (X, y):
+        digest.update(f'{array.dtype.str}{array.shape}'.encode())
+        digest.update(np.ascontiguousarray(array).data)
+    values, counts = np.unique(y, return_counts=True)
+    class_counts = {str(value): int(count) for value, count in zip(values, counts)}
+    name = f'{spec.name}_{spec.group}_data'
+    return {
+        'name': name if factor is None else f'{name}_{factor}',
+        'dataset': spec.name,
+        'title': spec.title,
+        'homepage': spec.url,
+        'group': spec.group,
+        'factor': factor,
+        'n_samples': X.shape[0],
+        'n_features': X.shape[1],
+        'class_counts': class_counts,
+        'imbalance_ratio': (
+            float(counts.max() / counts.min()) if len(counts) > 1 else None
+        ),
+        'sha256': digest.hexdigest(),
+        'n_bytes': X.nbytes + y.nbytes,
+    }
+
+
+def read_index(root=METADATA_PATH):
+    """Return the metadata of all the datasets, keyed by their names."""
+    entries = (json.loads(path.read_text()) for path in Path(root).glob('*.json'))
+    return {entry['name']: entry for entry in sorted(entries, key=lambda e: e['name'])}
+
+
+def query(root=METADATA_PATH, **conditions):
+    """Select datasets by their metadata, without loading their data.
+
+    Every condition is either a value, which the metadata field has to equal, or a
+    predicate of the field, which is not satisfied by missing values, e.g.
+    ``query(imbalance_ratio=lambda ratio: ratio > 10, factor=None)``.
+
+    Returns:
+        The metadata of the selected datasets, sorted by their names.
+    """
+    selected = []
+    for entry in read_index(root).values():
+        for key, condition in conditions.items():
+            value = entry.get(key)
+            if callable(condition):
+                if value is None or not condition(value):
+                    break
+            elif value != condition:
+                break
+        else:
+            selected.append(entry)
+    return selected
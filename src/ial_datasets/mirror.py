@@ -0,0 +1,95 @@
+"""Local mirror of the files of the upstream sources."""
+
+import json
+import logging
+import os
+import shutil
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from ._io import atomic_path, write_json
+from .fetch import fetch_all, mirror_path
+from .pipelines.data_downloading.nodes import get_sources
+from .registry import DATASETS, SPECS
+
+logger = logging.getLogger(__name__)
+
+
+def _read_index(root):
+    try:
+        return json.loads((root / 'index.json').read_text())
+    except FileNotFoundError:
+        return {'datasets': {}, 'files': {}}
+
+
+def _copy(src, dst):
+    """Copy a file, as a hard link when possible, replacing ``dst`` atomically."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_path(dst) as tmp_path:
+        try:
+            os.link(src, tmp_path)
+        except OSError:
+            shutil.copyfile(src, tmp_path)
+
+
+def build_mirror(params, root, names=None):
+    """Snapshot the files of the datasets into a local mirror.
+
+    The files are fetched through the download cache and stored under ``root`` at
+    the host and path of their URLs, so that a static HTTP server of ``root`` serves
+    them at the ``mirror_url`` parameter. The ``index.json`` file of the mirror maps
+    every dataset to the URLs of its files and every URL to its path, size and
+    SHA-256 checksum.
+
+    Returns:
+        The URLs that could not be fetched.
+    """
+    root = Path(root)
+    specs = SPECS if names is None else [DATASETS[name] for name in names]
+    params = {**params, 'mirror_url': None}
+    sources = {spec.name: get_sources(params, spec) for spec in specs}
+    urls = [url for spec_urls, _ in sources.values() for url in spec_urls]
+    sha256s = [
+        sha256 for _, spec_sha256s in sources.values() for sha256 in spec_sha256s
+    ]
+    paths = fetch_all(urls, params, sha256s, return_exceptions=True)
+    root.mkdir(parents=True, exist_ok=True)
+    index = _read_index(root)
+    failed = []
+    for url, path in zip(urls, paths):
+        if isinstance(path, Exception):
+            logger.warning('Failed to mirror %s: %s', url, path)
+            failed.append(url)
+            continue
+        _copy(path, root / mirror_path(url))
+        # The blobs of the download cache are named by their SHA-256 checksum.
+        index['files'][url] = {
+            'path': mirror_path(url),
+            'size': path.stat().st_size,
+            'sha256': path.name,
+        }
+    for name, (spec_urls, _) in sources.items():
+        index['datasets'][name] = spec_urls
+    write_json(root / 'index.json', index)
+    logger.info('Mirrored %d files into %s.', len(urls) - len(failed), root)
+    return failed
+
+
+def _make_server(root, host, port):
+    handler = partial(SimpleHTTPRequestHandler, directory=str(root))
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def serve_mirror(root, host, port):
+    """Serve a local mirror over HTTP until interrupted."""
+    with _make_server(root, host, port) as server:
+        logger.info(
+            'Serving %s at http://%s:%d/, set mirror_url to use it.',
+            root,
+            *server.server_address[:2],
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
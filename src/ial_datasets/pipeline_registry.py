@@ -1,10 +1,47 @@
 """Project pipelines."""
 
+import importlib
+from collections.abc import Mapping
+from pathlib import Path
 from typing import Dict
 
-from kedro.framework.project import find_pipelines
 from kedro.pipeline import Pipeline
 
+PIPELINES_PATH = Path(__file__).parent / 'pipelines'
+
+
+class _LazyPipelines(Mapping):
+    """Mapping from pipeline names to pipelines, created on first access.
+
+    Only the modules of the requested pipelines are imported, so that running a
+    single pipeline does not import the dependencies of the others.
+    """
+
+    def __init__(self):
+        self._names = sorted(
+            path.parent.name for path in PIPELINES_PATH.glob('*/pipeline.py')
+        )
+        self._pipelines = {}
+
+    def __getitem__(self, name):
+        if name not in self._pipelines:
+            if name == '__default__':
+                self._pipelines[name] = sum(
+                    self[pipeline_name] for pipeline_name in self._names
+                )
+            elif name in self._names:
+                module = importlib.import_module(f'ial_datasets.pipelines.{name}')
+                self._pipelines[name] = module.create_pipeline()
+            else:
+                raise KeyError(name)
+        return self._pipelines[name]
+
+    def __iter__(self):
+        return iter([*self._names, '__default__'])
+
+    def __len__(self):
+        return len(self._names) + 1
+
 
 def register_pipelines() -> Dict[str, Pipeline]:
     """Register the project's pipelines.
@@ -12,6 +49,4 @@ def register_pipelines() -> Dict[str, Pipeline]:
     Returns:
         A mapping from pipeline names to ``Pipeline`` objects.
     """
-    pipelines = find_pipelines()
-    pipelines["__default__"] = sum(pipelines.values())
-    return pipelines
+    return _LazyPipelines()
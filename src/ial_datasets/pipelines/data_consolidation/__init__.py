@@ -0,0 +1,3 @@
+"""Pipeline to consolidate the transformed and processed data into a corpus."""
+
+from .pipeline import create_pipeline  # NOQA
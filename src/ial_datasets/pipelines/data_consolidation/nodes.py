@@ -0,0 +1,3 @@
+def consolidate(**data):
+    """Return the data frames to store in the corpus, keyed by their names."""
+    return data
@@ -0,0 +1,27 @@
+from kedro.pipeline import Pipeline, node, pipeline
+
+from ...registry import BALANCED, IMBALANCED, SPECS
+from .nodes import consolidate
+
+
+def create_pipeline(**kwargs) -> Pipeline:
+    data_names = [
+        f'{spec.name}_{spec.group}_data'
+        for spec in SPECS
+        if spec.group in (BALANCED, IMBALANCED)
+    ]
+    data_names += [
+        f'{spec.name}_{IMBALANCED}_data_{factor}'
+        for spec in SPECS
+        for factor in spec.factors
+    ]
+    return pipeline(
+        [
+            node(
+                func=consolidate,
+                inputs={data_name: data_name for data_name in data_names},
+                outputs='corpus',
+                name='consolidate_corpus_node',
+            )
+        ]
+    )
@@ -1,617 +1,293 @@
-from io import BytesIO, StringIO
-from re import sub
-from string import ascii_lowercase
-from urllib.parse import urljoin
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from pathlib import PurePosixPath
+from urllib.parse import urljoin, urlsplit
 from zipfile import ZipFile
 
+import numpy as np
 import pandas as pd
-import requests
 
-
-def download_abalone(params):
-    """Download the Abalone Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Abalone
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['abalone']
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_acute(params):
-    """Download the Acute Inflammations Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Acute+Inflammations
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['acute']
-    )
-    data = pd.read_csv(url, header=None, sep='\t', decimal=',', encoding='UTF-16')
-    return data
-
-
-def download_adult(params):
-    """Download the Adult Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Adult
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['adult']
-    )
-    data = pd.read_csv(url, header=None, na_values=' ?')
-    return data
-
-
-def download_annealing(params):
-    """Download the Annealing Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Annealing
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['annealing']
-    )
-    data = pd.read_csv(url, header=None, na_values='?')
-    return data
-
-
-def download_arcene(params):
-    """Download the Arcene Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Arcene
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls']['arcene'],
-    )
-    data, labels = [], []
-    for data_type in ('train', 'valid'):
-        data.append(
-            pd.read_csv(
-                urljoin(url, f'ARCENE/arcene_{data_type}.data'),
-                header=None,
-                sep=' ',
-            )
+from ...fetch import DEFAULT_CONCURRENCY_PARAMS, fetch, fetch_all, to_mirror_url
+from ...readers import read_arff
+from ...registry import DATASETS
+from ...utils import DEFAULT_DTYPES
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zip': 'zip'}
+DEFAULT_MEMORY_BUDGET = 256 * 1024**2
+# Rows parsed to estimate the memory of a row and ratio of the peak memory of a block,
+# while it is parsed, converted and written, to its final size.
+SAMPLE_ROWS = 1000
+BLOCK_OVERHEAD = 4
+INT_DTYPE = 'int32'
+
+
+def get_sources(params, spec):
+    """Get the URLs of the files of a dataset and their pinned checksums.
+
+    Checksums are pinned in the ``checksums`` mapping of the URLs parameters, either
+    directly for single-file datasets or as a mapping from file names to checksums.
+    The URLs point to the mirror served at the ``mirror_url`` parameter, if set.
+    """
+    urls_params = params[f'{spec.group}_data_urls']
+    base_url = urls_params['keel'] if spec.source == 'keel' else params['uci_url']
+    urls = urls_params[spec.name]
+    if isinstance(urls, str):
+        urls = [urls]
+    urls = [urljoin(base_url, url) for url in urls]
+    if spec.parts is not None:
+        urls = [urljoin(urls[0], part) for part in spec.parts]
+    sha256 = urls_params.get('checksums', {}).get(spec.name)
+    if isinstance(sha256, dict):
+        sha256s = [sha256.get(url.rsplit('/', 1)[-1]) for url in urls]
+    else:
+        sha256s = [sha256] * len(urls)
+    if params.get('mirror_url'):
+        urls = [to_mirror_url(url, params['mirror_url']) for url in urls]
+    return urls, sha256s
+
+
+def _read_zipped_csv(path, member, **kwargs):
+    """Read a CSV file from a ZIP archive while decompressing it."""
+    with ZipFile(path) as archive, archive.open(member) as file:
+        return pd.read_csv(file, **kwargs)
+
+
+def _read_keel(path, member):
+    """Read a KEEL data file from a ZIP archive while decompressing it."""
+    with ZipFile(path) as archive, archive.open(member) as file:
+        return read_arff(file)
+
+
+READERS = {
+    'csv': pd.read_csv,
+    'excel': pd.read_excel,
+    'zipped_csv': _read_zipped_csv,
+    'keel': _read_keel,
+}
+
+
+def _fetch_and_read_all(urls, sha256s, reads, params):
+    """Fetch several files concurrently and read each one as soon as it is fetched.
+
+    The files are read in the calling thread, while the others are being fetched.
+    """
+    max_workers = params.get('download_concurrency', {}).get(
+        'max_workers', DEFAULT_CONCURRENCY_PARAMS['max_workers']
+    )
+    parts = [None] * len(urls)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        futures = {
+            executor.submit(fetch, url, params, sha256): i
+            for i, (url, sha256) in enumerate(zip(urls, sha256s))
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            parts[i] = reads[i](future.result())
+    return parts
+
+
+def _common_dtype(dtypes):
+    if all(dtype == dtypes[0] for dtype in dtypes) and isinstance(dtypes[0], np.dtype):
+        return dtypes[0]
+    if all(isinstance(dtype, np.dtype) and dtype.kind in 'iuf' for dtype in dtypes):
+        return np.result_type(*dtypes)
+    return np.dtype(object)
+
+
+def _assemble(parts):
+    """Concatenate the rows of frames into a frame of preallocated blocks.
+
+    The columns of every common dtype are stored in a block, which is allocated
+    uninitialized, so that its memory is only committed as the rows are copied into
+    it. Every frame is removed from ``parts`` and released once copied, so that the
+    frames and the blocks are not both held in memory at the peak. As in
+    ``pd.concat``, the dtypes of empty frames are ignored.
+    """
+    labels = parts[0].columns
+    if any(not part.columns.equals(labels) for part in parts):
+        raise ValueError('The files of a dataset have different columns.')
+    n_rows = sum(len(part) for part in parts)
+    groups = {}
+    typed_parts = [part for part in parts if len(part)] or parts
+    for i, dtypes in enumerate(zip(*(part.dtypes.to_numpy() for part in typed_parts))):
+        groups.setdefault(_common_dtype(dtypes), []).append(i)
+    blocks = {
+        dtype: np.empty((len(positions), n_rows), dtype)
+        for dtype, positions in groups.items()
+    }
+    # Contiguous columns are selected as a slice, which does not copy them.
+    selections = {
+        dtype: (
+            slice(positions[0], positions[-1] + 1)
+            if positions == list(range(positions[0], positions[-1] + 1))
+            else positions
         )
-        labels.append(
-            pd.read_csv(
-                urljoin(
-                    url,
-                    ('ARCENE/' if data_type == 'train' else '')
-                    + f'arcene_{data_type}.labels',
-                ),
-                header=None,
+        for dtype, positions in groups.items()
+    }
+    start = 0
+    while parts:
+        part = parts.pop(0)
+        stop = start + len(part)
+        for dtype, selection in selections.items():
+            values = part.iloc[:, selection].to_numpy(dtype=dtype)
+            blocks[dtype][:, start:stop] = values.T
+        start = stop
+    if len(blocks) == 1:
+        (block,) = blocks.values()
+        return pd.DataFrame(block.T, columns=labels, copy=False)
+    columns = {
+        i: block[j]
+        for dtype, block in blocks.items()
+        for j, i in enumerate(groups[dtype])
+    }
+    return pd.DataFrame(
+        {label: columns[i] for i, label in enumerate(labels)}, copy=False
+    )
+
+
+def _infer_compression(url):
+    """Infer the compression of a file from the extension of its URL."""
+    return COMPRESSIONS.get(PurePosixPath(urlsplit(url).path).suffix)
+
+
+def prefetch(params, names):
+    """Fetch the files of several datasets concurrently into the download cache.
+
+    Failed downloads are only logged, since the nodes retry them.
+    """
+    urls, sha256s = [], []
+    for name in names:
+        for url, sha256 in zip(*get_sources(params, DATASETS[name])):
+            urls.append(url)
+            sha256s.append(sha256)
+    paths = fetch_all(urls, params, sha256s, return_exceptions=True)
+    for url, path in zip(urls, paths):
+        if isinstance(path, Exception):
+            logger.warning('Failed to prefetch %s: %s', url, path)
+
+
+def download(params, spec):
+    """Download a dataset and read its files as described by its spec.
+
+    The rows of all the files are concatenated. When the files alternate between
+    data and labels files, the labels are appended as the last column. Compressed
+    CSV files are decompressed while they are parsed. The files of a dataset split
+    in several files are fetched concurrently and each one is read as soon as it is
+    fetched, and their rows are copied into preallocated blocks instead of being
+    concatenated.
+    """
+    urls, sha256s = get_sources(params, spec)
+    read_kwargs = spec.read_kwargs
+    if spec.reader == 'csv':
+        read_kwargs = {'compression': _infer_compression(urls[0]), **read_kwargs}
+    read = partial(READERS[spec.reader], **read_kwargs)
+    if len(urls) == 1:
+        return read(fetch(urls[0], params, sha256s[0]))
+    reads = [read] * len(urls)
+    if spec.labels:
+        reads[1::2] = [partial(pd.read_csv, header=None, usecols=[0])] * len(urls[1::2])
+    parts = _fetch_and_read_all(urls, sha256s, reads, params)
+    if not spec.labels:
+        return _assemble(parts)
+    X_parts, y_parts = parts[0::2], parts[1::2]
+    del parts
+    data = _assemble(X_parts)
+    data[data.shape[1]] = _assemble(y_parts)[0].to_numpy()
+    return data
+
+
+def _scan_columns(blocks, target_col, features_dtype):
+    """Return the dtypes of the feature columns of all the blocks and their rows.
+
+    A column is read as strings when it holds strings in any block, converted to
+    the features dtype when it holds floats or missing values in any block, and to
+    ``INT_DTYPE`` when it only holds integers that fit in it in all the blocks, or
+    kept as ``int64`` otherwise, so that all the partitions have the same schema.
+    """
+    kinds, lows, highs, n_rows = {}, {}, {}, 0
+    for block in blocks:
+        n_rows += len(block)
+        if target_col is None:
+            target_col = block.columns[-1]
+        features = block.drop(columns=target_col)
+        for col, dtype in features.dtypes.items():
+            kinds.setdefault(col, set()).add(dtype.kind)
+        integers = features.select_dtypes('integer')
+        if len(integers):
+            for col, low in integers.min().items():
+                lows[col] = min(low, lows.get(col, low))
+            for col, high in integers.max().items():
+                highs[col] = max(high, highs.get(col, high))
+    int_info = np.iinfo(INT_DTYPE)
+    column_dtypes = {}
+    for col, col_kinds in kinds.items():
+        if 'O' in col_kinds:
+            column_dtypes[col] = str
+        elif 'f' in col_kinds:
+            column_dtypes[col] = features_dtype
+        elif col_kinds == {'i'}:
+            fits = (
+                int_info.min <= lows.get(col, 0) and highs.get(col, 0) <= int_info.max
             )
-        )
-    data = pd.concat(data, ignore_index=True)
-    labels = pd.concat(labels, ignore_index=True).rename(columns={0: data.shape[1] + 1})
-    data = pd.concat([data, labels], axis=1)
-    return data
-
-
-def download_audit(params):
-    """Download the Audit Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Audit+Data
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls']['audit'],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data)).read('audit_data/audit_risk.csv').decode('utf-8')
-    )
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), engine='python')
-    return data
-
-
-def download_banknote_authentication(params):
-    """Download the Banknote Authentication Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/banknote+authentication
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls'][
-            'banknote_authentication'
-        ],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_breast_cancer(params):
-    """Download the Breast Cancer Wisconsin Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Breast+Cancer+Wisconsin+(Diagnostic)
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls']['breast_cancer'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_breast_tissue(params):
-    """Download the Breast Tissue Data Set.
-
-    http://archive.ics.uci.edu/ml/datasets/breast+tissue
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls'][
-            'breast_tissue'
-        ],
-    )
-    data = pd.read_excel(url, sheet_name='Data')
-    return data
-
-
-def download_contraceptive(params):
-    """Download the Contraceptive Method Choice Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Contraceptive+Method+Choice
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['mixed_features_binary_target_data_urls']['contraceptive'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_credit_approval(params):
-    """Download the Credit Approval Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Credit+Approval
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['mixed_features_binary_target_data_urls']['credit_approval'],
-    )
-    data = pd.read_csv(url, header=None, na_values='?')
-    return data
-
-
-def download_echocardiogram(params):
-    """Download the Echocardiogram Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Echocardiogram
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['mixed_features_binary_target_data_urls']['echocardiogram'],
-    )
-    data = pd.read_csv(
-        url,
-        header=None,
-        error_bad_lines=False,
-        warn_bad_lines=False,
-        na_values='?',
-    )
-    return data
-
-
-def download_flags(params):
-    """Download the Flags Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Flags
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['flags']
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_heart_disease(params):
-    """Download the Heart Disease Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Heart+Disease
-    """
-    urls = urljoin(
-        params['uci_url'],
-        params['mixed_features_binary_target_data_urls']['heart_disease'],
-    )
-    data = pd.concat(
-        [pd.read_csv(url, header=None, na_values='?') for url in urls],
-        ignore_index=True,
-    )
-    return data
-
-
-def download_hepatitis(params):
-    """Download the Hepatitis Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Hepatitis
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['hepatitis']
-    )
-    data = pd.read_csv(url, header=None, na_values='?')
-    return data
-
-
-def download_german_credit(params):
-    """Download the German Credit Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Statlog+%28German+Credit+Data%29
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['mixed_features_binary_target_data_urls']['german_credit'],
-    )
-    data = pd.read_csv(url, header=None, sep=' ')
-    return data
-
-
-def download_cleveland(params):
-    """Download the Heart Disease Cleveland Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=980
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['cleveland'],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data)).read('cleveland-0_vs_4.dat').decode('utf-8')
-    )
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), header=None)
-    return data
-
-
-def download_dermatology(params):
-    """Download the Dermatology Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=1330
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['dermatology'],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data)).read('dermatology-6.dat').decode('utf-8')
-    )
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), header=None)
-    return data
-
-
-def download_ecoli(params):
-    """Download the Ecoli Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/ecoli
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['ecoli'],
-    )
-    data = pd.read_csv(url, header=None, delim_whitespace=True)
-    return data
-
-
-def download_eucalyptus(params):
-    """Download the Eucalyptus Data Set.
-
-    https://www.openml.org/d/188
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['eucalyptus'],
-    )
-    data = pd.read_csv(url)
-    return data
-
-
-def download_glass(params):
-    """Download the Glass Identification Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/glass+identification
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['glass'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_haberman(params):
-    """Download the Haberman's Survival Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Haberman's+Survival
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['haberman'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_heart(params):
-    """Download the Heart Data Set.
-
-    http://archive.ics.uci.edu/ml/datasets/statlog+(heart)
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['heart'],
-    )
-    data = pd.read_csv(url, header=None, delim_whitespace=True)
-    return data
-
-
-def download_ionosphere(params):
-    """Download the Ionosphere Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/ionosphere
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls']['ionosphere'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_iris(params):
-    """Download the Iris Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/iris
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['iris'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_led(params):
-    """Download the LED Display Domain Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=998
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['led'],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data))
-        .read('led7digit-0-2-4-5-6-7-8-9_vs_1.dat')
-        .decode('utf-8')
-    )
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), header=None)
-    return data
-
-
-def download_libras(params):
-    """Download the Libras Movement Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Libras+Movement
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['libras'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_liver(params):
-    """Download the Liver Disorders Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/liver+disorders
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['liver'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_madelon(params):
-    """Download the Arcene Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Madelon
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['madelon'],
-    )
-    X = pd.read_csv(url.format('data'), header=None, sep=' ')
-    y = pd.read_csv(url.format('labels'), header=None, sep=' ')
-    data = pd.concat([X, y], axis=1)
-    return data
-
-
-def download_new_thyroid_1(params):
-    """Download the Thyroid 1 Disease Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=145
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls'][
-            'new_thyroid_1'
-        ],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data)).read('new-thyroid1.dat').decode('utf-8')
-    )
-    data = pd.read_csv(
-        StringIO(sub(r'@.+\n+', '', unzipped_data)),
-        header=None,
-        sep=', ',
-        engine='python',
-    )
-    return data
-
-
-def download_new_thyroid_2(params):
-    """Download the Thyroid 2 Disease Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=146
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls'][
-            'new_thyroid_2'
-        ],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data)).read('newthyroid2.dat').decode('utf-8')
-    )
-    data = pd.read_csv(
-        StringIO(sub(r'@.+\n+', '', unzipped_data)),
-        header=None,
-        sep=', ',
-        engine='python',
-    )
-    return data
-
-
-def download_page_blocks_1_3(params):
-    """Download the Page Blocks 1-3 Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=124
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls'][
-            'page_blocks_1_3'
-        ],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = (
-        ZipFile(BytesIO(zipped_data)).read('page-blocks-1-3_vs_4.dat').decode('utf-8')
-    )
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), header=None)
-    return data
-
-
-def download_parkinsons(params):
-    """Download the Parkinsons Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/parkinsons
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls']['parkinsons'],
-    )
-    data = pd.read_csv(url)
-    return data
-
-
-def download_pima(params):
-    """Download the Pima Indians Diabetes Data Set.
-
-    https://www.kaggle.com/uciml/pima-indians-diabetes-database
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['pima'],
-    )
-    data = pd.read_csv(url, header=None, skiprows=9)
-    return data
-
-
-def download_spambase(params):
-    """Download and transform the Spambase Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Spambase
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_balanced_data_urls']['spambase'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_vehicle(params):
-    """Download the Vehicle Silhouettes Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Statlog+(Vehicle+Silhouettes)
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['vehicle'],
-    )
-    data = []
-    for letter in ascii_lowercase[0:9]:
-        partial_data = pd.read_csv(
-            urljoin(url, 'xa%s.dat' % letter),
-            header=None,
-            delim_whitespace=True,
-        )
-        partial_data = partial_data.rename(columns={18: 'target'})
-        partial_data['target'] = partial_data['target'].isin(['van']).astype(int)
-        data.append(partial_data)
-    data = pd.concat(data)
-    return data
-
-
-def download_vowel(params):
-    """Download the Vowel Recognition Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=127
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['vowel'],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = ZipFile(BytesIO(zipped_data)).read('vowel0.dat').decode('utf-8')
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), header=None)
-    return data
-
-
-def download_wine(params):
-    """Download the Wine Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/wine
-    """
-    url = urljoin(
-        params['uci_url'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['wine'],
-    )
-    data = pd.read_csv(url, header=None)
-    return data
-
-
-def download_yeast_1(params):
-    """Download the Yeast 1 Data Set.
-
-    http://sci2s.ugr.es/keel/dataset.php?cod=153
-    """
-    url = urljoin(
-        params['numerical_features_binary_target_imbalanced_data_urls']['keel'],
-        params['numerical_features_binary_target_imbalanced_data_urls']['yeast_1'],
-    )
-    zipped_data = requests.get(url).content
-    unzipped_data = ZipFile(BytesIO(zipped_data)).read('yeast1.dat').decode('utf-8')
-    data = pd.read_csv(StringIO(sub(r'@.+\n+', '', unzipped_data)), header=None)
-    return data
-
-
-def download_thyroid(params):
-    """Download the Thyroid Disease Data Set.
-
-    https://archive.ics.uci.edu/ml/datasets/Thyroid+Disease
-    """
-    url = urljoin(
-        params['uci_url'], params['mixed_features_binary_target_data_urls']['thyroid']
-    )
-    data = pd.read_csv(url, header=None, na_values='?')
-    return data
+            column_dtypes[col] = INT_DTYPE if fits else 'int64'
+    return column_dtypes, n_rows
+
+
+def _convert_block(block, spec, dtypes, column_dtypes):
+    """Convert the dtypes of a block and map its target to a binary column."""
+    target_col = block.columns[-1] if spec.target_col is None else spec.target_col
+    target_vals = [1] if spec.target_vals is None else spec.target_vals
+    y = block[target_col].isin(target_vals).astype(dtypes['target']).rename('target')
+    X = block.drop(columns=target_col).astype(column_dtypes)
+    X.columns = range(X.shape[1])
+    return pd.concat([X, y], axis=1)
+
+
+def ingest(params, spec):
+    """Download a large dataset and read it in blocks bounded by the memory budget.
+
+    The rows of a block are sized from the memory of a sample of rows, so that a
+    block takes at most the ``memory_budget`` of the ``chunked_ingest`` parameters
+    while it is parsed, converted and written. The dtypes of the columns are set
+    from a first pass over all the blocks and applied to every block: integer
+    columns are converted to 32 bits when all their values fit, float columns to
+    the features dtype of the ``dtypes`` parameters and the target is mapped to a
+    binary ``target`` column of their target dtype.
+
+    Returns:
+        A dictionary of partition ids to functions that read the blocks, in order,
+        which are called one at a time when the partitions are saved.
+    """
+    urls, sha256s = get_sources(params, spec)
+    (path,) = fetch_all(urls, params, sha256s)
+    compression = _infer_compression(urls[0])
+    read_kwargs = {'compression': compression, **spec.read_kwargs}
+    memory_budget = params.get('chunked_ingest', {}).get(
+        'memory_budget', DEFAULT_MEMORY_BUDGET
+    )
+    sample = pd.read_csv(path, nrows=SAMPLE_ROWS, **read_kwargs)
+    row_size = sample.memory_usage(index=True, deep=True).sum() / len(sample)
+    block_size = max(1, int(memory_budget / (row_size * BLOCK_OVERHEAD)))
+    dtypes = {**DEFAULT_DTYPES, **params.get('dtypes', {})}
+    column_dtypes, n_rows = _scan_columns(
+        pd.read_csv(path, chunksize=block_size, **read_kwargs),
+        spec.target_col,
+        dtypes['features'],
+    )
+    n_blocks = -(-n_rows // block_size)
+    logger.info(
+        'Ingesting %s in %d blocks of %d rows.', spec.name, n_blocks, block_size
+    )
+    blocks = pd.read_csv(path, chunksize=block_size, dtype=column_dtypes, **read_kwargs)
+    empty = _convert_block(sample.iloc[:0], spec, dtypes, column_dtypes)
+
+    def read_block():
+        block = next(blocks, None)
+        if block is None:
+            return empty
+        return _convert_block(block, spec, dtypes, column_dtypes)
+
+    return {f'part-{i:05d}': read_block for i in range(n_blocks)}
@@ -1,57 +1,82 @@
-from collections import Counter
+import zlib
 
+import numpy as np
 import pandas as pd
-from imblearn.datasets import make_imbalance
-
-FACTOR_MAPPING = {
-    'breast_tissue': [1, 2, 3, 4],
-    'cleveland': [1],
-    'dermatology': [1, 2],
-    'ecoli': [1, 2, 3, 4, 5],
-    'eucalyptus': [1, 2, 3, 4, 5],
-    'glass': [1, 2, 3, 4, 5],
-    'haberman': [1, 2, 3, 4, 5],
-    'heart': [1, 2, 3, 4, 5],
-    'iris': [1, 2, 3, 4, 5],
-    'led': [1, 2, 3, 4],
-    'libras': [1, 2, 3],
-    'liver': [1, 2, 3, 4, 5],
-    'madelon': [1, 2, 3, 4, 5],
-    'new_thyroid_1': [1, 2, 3, 4],
-    'new_thyroid_2': [1, 2, 3, 4],
-    'page_blocks_1_3': [1, 2, 3],
-    'pima': [1, 2, 3, 4, 5],
-    'vehicle': [1, 2, 3, 4, 5],
-    'vowel': [1, 2, 3, 4, 5],
-    'wine': [1, 2, 3, 4, 5],
-    'yeast_1': [1, 2, 3, 4, 5],
-}
-
-
-def make_data_imbalanced(data, params, factor):
-    ratio = Counter(data['target']).copy()
-    ratio[1] = int(ratio[1] / factor)
-    X_imb, y_imb = make_imbalance(
-        data.drop(columns='target'),
-        data['target'],
-        sampling_strategy=ratio,
-        random_state=params['random_state'],
-    )
-    data_imbalanced = pd.concat([X_imb, y_imb], axis=1).reset_index(drop=True)
-    return data_imbalanced
-
-
-def generate_process_funcs():
-    process_funcs = []
-    for data_name, factors in FACTOR_MAPPING.items():
+
+from ...metadata import describe
+from ...registry import DATASETS, SPECS
+
+FACTOR_MAPPING = {spec.name: list(spec.factors) for spec in SPECS if spec.factors}
+
+
+def sample_imbalanced_indices(y, factors, seeds):
+    """Return the sorted row indices of the imbalanced variants of a binary target.
+
+    For every seed the minority rows are permuted once, and the variant of each
+    factor keeps all majority rows and the first ``n_minority // factor`` rows of
+    this permutation, so that the variants of larger factors are nested in the
+    variants of smaller ones. The indices are keyed by factor and seed position.
+    """
+    minority_indices = np.flatnonzero(y == 1)
+    majority_mask = y != 1
+    indices = {}
+    for position, seed in enumerate(seeds):
+        permutation = np.random.default_rng(seed).permutation(minority_indices)
         for factor in factors:
-            process_funcs.append(
-                (
-                    data_name,
-                    factor,
-                    lambda data, params, factor=factor: make_data_imbalanced(
-                        data, params, factor
-                    ),
-                )
-            )
-    return process_funcs
+            mask = majority_mask.copy()
+            mask[permutation[: int(minority_indices.size / factor)]] = True
+            indices[(factor, position)] = np.flatnonzero(mask)
+    return indices
+
+
+def make_fold_labels(y, n_splits, n_repeats, seed):
+    """Return the labels of the stratified folds of the rows of a target.
+
+    For every repeat the rows are shuffled and stably sorted by class, and the fold
+    labels are dealt to them in turn, so that the size of every fold and its number
+    of rows of every class differ by at most one from the other folds. The labels
+    are ``int32`` and keyed by repeat.
+    """
+    rng = np.random.default_rng(seed)
+    labels = np.arange(y.size, dtype=np.int32) % n_splits
+    folds = {}
+    for repeat in range(n_repeats):
+        order = rng.permutation(y.size)
+        order = order[np.argsort(y[order], kind='stable')]
+        folds[repeat] = np.empty_like(labels)
+        folds[repeat][order] = labels
+    return pd.DataFrame(folds)
+
+
+def make_data_imbalanced(data, params, data_name, factors):
+    """Return the imbalanced variants of the data, their metadata and their folds.
+
+    The random generators are seeded by ``SeedSequence`` objects of the random state
+    spawned for the dataset, and for the factor for the folds, so that the variants
+    and their folds do not depend on the order of the nodes. The rows of every
+    variant keep their order in the input data, unlike the variants sampled with
+    ``imblearn``, whose rows were grouped by class. Its index holds the positions
+    of its rows in the input data, and its folds are given for the rows in this
+    order.
+    """
+    spawn_key = (zlib.crc32(data_name.encode()),)
+    seed = np.random.SeedSequence(params['random_state'], spawn_key=spawn_key)
+    indices = sample_imbalanced_indices(data['target'].to_numpy(), factors, [seed])
+    data = data.reset_index(drop=True)
+    variants = [data.take(indices[(factor, 0)]) for factor in factors]
+    spec = DATASETS[data_name]
+    metadata = [
+        describe(variant, spec, factor) for variant, factor in zip(variants, factors)
+    ]
+    folds = [
+        make_fold_labels(
+            variant['target'].to_numpy(),
+            params['cv']['n_splits'],
+            params['cv']['n_repeats'],
+            np.random.SeedSequence(
+                params['random_state'], spawn_key=(*spawn_key, factor)
+            ),
+        )
+        for variant, factor in zip(variants, factors)
+    ]
+    return [*variants, *metadata, *folds]
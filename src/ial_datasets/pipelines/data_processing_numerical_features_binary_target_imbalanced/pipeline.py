@@ -1,24 +1,37 @@
+from functools import partial, update_wrapper
+
 from kedro.pipeline import Pipeline, node, pipeline
 
-from .nodes import generate_process_funcs
+from .nodes import FACTOR_MAPPING, make_data_imbalanced
 
 
 def create_pipeline(**kwargs) -> Pipeline:
-    process_funcs = generate_process_funcs()
     nodes = []
-    for data_name, factor, process_func in process_funcs:
+    for data_name, factors in FACTOR_MAPPING.items():
         input_data_name = (
             f'{data_name}_numerical_features_binary_target_imbalanced_data'
         )
-        output_data_name = (
+        output_data_names = [
             f'{data_name}_numerical_features_binary_target_imbalanced_data_{factor}'
-        )
+            for factor in factors
+        ]
+        output_data_names += [
+            f'{data_name}_numerical_features_binary_target_imbalanced_metadata_{factor}'
+            for factor in factors
+        ]
+        output_data_names += [
+            f'{data_name}_numerical_features_binary_target_imbalanced_folds_{factor}'
+            for factor in factors
+        ]
         nodes.append(
             node(
-                func=process_func,
+                func=update_wrapper(
+                    partial(make_data_imbalanced, data_name=data_name, factors=factors),
+                    make_data_imbalanced,
+                ),
                 inputs=[input_data_name, 'parameters'],
-                outputs=output_data_name,
-                name=f'{data_name}_{factor}_node',
+                outputs=output_data_names,
+                name=f'{data_name}_node',
             )
         )
     return pipeline(nodes)
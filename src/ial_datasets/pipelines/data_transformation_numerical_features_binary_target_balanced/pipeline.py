@@ -1,34 +1,26 @@
+from functools import partial, update_wrapper
+
 from kedro.pipeline import Pipeline, node, pipeline
 
-from .nodes import (
-    transform_arcene,
-    transform_audit,
-    transform_banknote_authentication,
-    transform_breast_cancer,
-    transform_ionosphere,
-    transform_parkinsons,
-    transform_spambase,
-)
+from ...registry import BALANCED, SPECS
+from ...utils import transform_and_describe
 
 
 def create_pipeline(**kwargs) -> Pipeline:
-    transform_funcs = [
-        transform_arcene,
-        transform_audit,
-        transform_banknote_authentication,
-        transform_breast_cancer,
-        transform_ionosphere,
-        transform_parkinsons,
-        transform_spambase,
-    ]
     return pipeline(
         [
             node(
-                func=func,
-                inputs=f'{func.__name__.replace("transform_", "")}_data',
-                outputs=f'{func.__name__.replace("transform_", "")}_numerical_features_binary_target_balanced_data',
-                name=f'{func.__name__}_numerical_features_binary_target_balanced_data_node',
+                func=update_wrapper(
+                    partial(transform_and_describe, spec=spec), transform_and_describe
+                ),
+                inputs={'data': f'{spec.name}_data', 'dtypes': 'params:dtypes'},
+                outputs=[
+                    f'{spec.name}_{spec.group}_data',
+                    f'{spec.name}_{spec.group}_metadata',
+                ],
+                name=f'transform_{spec.name}_{spec.group}_data_node',
             )
-            for func in transform_funcs
+            for spec in SPECS
+            if spec.group == BALANCED
         ]
     )
@@ -0,0 +1,85 @@
+"""Measurements of the resources used by the nodes."""
+
+import resource
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+PROC_PATH = Path('/proc/self')
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """Resources used by a call.
+
+    Args:
+        wall_time: Elapsed time in seconds.
+        cpu_time: CPU time of the process in seconds.
+        peak_memory: Peak resident set size of the process in bytes.
+        bytes_read: Bytes read by the process, from files and sockets.
+        bytes_written: Bytes written by the process, to files and sockets.
+    """
+
+    wall_time: float
+    cpu_time: float
+    peak_memory: int
+    bytes_read: int
+    bytes_written: int
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def _read_io():
+    try:
+        lines = (PROC_PATH / 'io').read_text().splitlines()
+    except OSError:
+        return 0, 0
+    counters = dict(line.split(': ') for line in lines)
+    return int(counters['rchar']), int(counters['wchar'])
+
+
+def _reset_peak_memory():
+    """Reset the peak resident set size of the process, if supported."""
+    try:
+        (PROC_PATH / 'clear_refs').write_text('5')
+    except OSError:
+        return False
+    return True
+
+
+def _read_peak_memory():
+    try:
+        for line in (PROC_PATH / 'status').read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def profile(func, *args, **kwargs):
+    """Call a function and measure the resources it used.
+
+    The peak memory is reset before the call on Linux, while on other platforms it
+    is the peak of the whole process.
+
+    Returns:
+        The result of the call and its ``Measurement``.
+    """
+    _reset_peak_memory()
+    bytes_read, bytes_written = _read_io()
+    cpu_time = time.process_time()
+    wall_time = time.perf_counter()
+    result = func(*args, **kwargs)
+    wall_time = time.perf_counter() - wall_time
+    cpu_time = time.process_time() - cpu_time
+    end_bytes_read, end_bytes_written = _read_io()
+    measurement = Measurement(
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        peak_memory=_read_peak_memory(),
+        bytes_read=end_bytes_read - bytes_read,
+        bytes_written=end_bytes_written - bytes_written,
+    )
+    return result, measurement
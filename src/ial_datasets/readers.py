@@ -0,0 +1,58 @@
+"""Readers of the file formats used by the data sources."""
+
+import re
+from io import TextIOBase, TextIOWrapper
+
+import pandas as pd
+
+ATTRIBUTE_PATTERN = re.compile(
+    r'@attribute\s+(\'[^\']*\'|"[^"]*"|[^\s{]+)\s*(.*)', flags=re.IGNORECASE
+)
+DTYPES_MAPPING = {
+    'real': 'float64',
+    'numeric': 'float64',
+    'integer': 'Int64',
+    'string': 'string',
+}
+NA_VALUES = ['?', '<null>']
+
+
+def _parse_dtype(attribute_type):
+    if attribute_type.startswith('{'):
+        return 'category'
+    # KEEL ranges may follow the type without a space, e.g. ``real[0.0,1.0]``.
+    type_name = re.split(r'[\s\[]', attribute_type, maxsplit=1)[0]
+    return DTYPES_MAPPING.get(type_name.lower(), 'object')
+
+
+def read_arff(file, **kwargs):
+    """Read an ARFF or KEEL data file.
+
+    The ``@attribute`` declarations of the header are parsed once to get the names
+    and types of the columns, and the ``@data`` section is then parsed by the C
+    engine with these types as explicit dtypes.
+    """
+    if not isinstance(file, TextIOBase):
+        file = TextIOWrapper(file, encoding='utf-8')
+    names, dtypes = [], {}
+    for raw_line in file:
+        line = raw_line.strip()
+        if line.lower().startswith('@data'):
+            break
+        match = ATTRIBUTE_PATTERN.match(line)
+        if match is not None:
+            name, attribute_type = match.groups()
+            name = name.strip('\'"')
+            names.append(name)
+            dtypes[name] = _parse_dtype(attribute_type.strip())
+    return pd.read_csv(
+        file,
+        header=None,
+        names=names,
+        dtype=dtypes,
+        skipinitialspace=True,
+        na_values=NA_VALUES,
+        comment='%',
+        quotechar='\'',
+        **kwargs,
+    )
@@ -0,0 +1,438 @@
+"""Registry of the datasets."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence
+
+BALANCED = 'numerical_features_binary_target_balanced'
+IMBALANCED = 'numerical_features_binary_target_imbalanced'
+MIXED = 'mixed_features_binary_target'
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Description of how a dataset is downloaded and transformed.
+
+    Args:
+        name: Name of the dataset in the parameters and the data catalog.
+        title: Title of the dataset.
+        url: Web page of the dataset.
+        group: Group of the dataset, which selects its URLs parameters and its
+            transformation pipeline.
+        reader: Reader of its files, either ``'csv'``, ``'excel'``,
+            ``'zipped_csv'`` or ``'keel'``.
+        read_kwargs: Keyword arguments of the reader.
+        source: Base URL of its relative URLs, either ``'uci'`` or ``'keel'``.
+        parts: Files of the dataset, relative to its URL.
+        labels: Whether its files alternate between data and labels files.
+        target_col: Column of the target, by default the last one.
+        target_vals: Values of the target mapped to the positive class.
+        chunked: Whether its file is ingested in blocks bounded by the memory budget
+            into partitions, converting the dtypes and mapping the target per block.
+        factors: Imbalance factors of its processed variants, only for imbalanced
+            datasets.
+    """
+
+    name: str
+    title: str
+    url: str
+    group: str
+    reader: str = 'csv'
+    read_kwargs: Dict[str, Any] = field(default_factory=dict)
+    source: str = 'uci'
+    parts: Optional[Sequence[str]] = None
+    labels: bool = False
+    target_col: Any = None
+    target_vals: Optional[Sequence[Any]] = None
+    chunked: bool = False
+    factors: Sequence[int] = ()
+
+
+@dataclass(frozen=True)
+class Excluding:
+    """Column selector of all the columns except the given ones."""
+
+    columns: Sequence[Any]
+
+    def __call__(self, column):
+        return column not in self.columns
+
+
+def _excluding(*columns):
+    return Excluding(columns)
+
+
+def _keel(name, title, code, member, factors):
+    return DatasetSpec(
+        name=name,
+        title=title,
+        url=f'http://sci2s.ugr.es/keel/dataset.php?cod={code}',
+        group=IMBALANCED,
+        reader='keel',
+        read_kwargs={'member': member},
+        source='keel',
+        target_vals=['positive'],
+        factors=factors,
+    )
+
+
+# Files without header select their columns by position, since callables passed as
+# ``usecols`` are applied to shifted columns. The specs are picklable, so that the
+# nodes built from them can run in subprocesses.
+SPECS = [
+    DatasetSpec(
+        name='abalone',
+        title='Abalone',
+        url='https://archive.ics.uci.edu/ml/datasets/Abalone',
+        group=MIXED,
+        read_kwargs={'header': None},
+    ),
+    DatasetSpec(
+        name='acute',
+        title='Acute Inflammations',
+        url='https://archive.ics.uci.edu/ml/datasets/Acute+Inflammations',
+        group=MIXED,
+        read_kwargs={
+            'header': None,
+            'sep': '\t',
+            'decimal': ',',
+            'encoding': 'UTF-16',
+        },
+    ),
+    DatasetSpec(
+        name='adult',
+        title='Adult',
+        url='https://archive.ics.uci.edu/ml/datasets/Adult',
+        group=MIXED,
+        read_kwargs={'header': None, 'na_values': ' ?'},
+    ),
+    DatasetSpec(
+        name='annealing',
+        title='Annealing',
+        url='https://archive.ics.uci.edu/ml/datasets/Annealing',
+        group=MIXED,
+        read_kwargs={'header': None, 'na_values': '?'},
+    ),
+    DatasetSpec(
+        name='arcene',
+        title='Arcene',
+        url='https://archive.ics.uci.edu/ml/datasets/Arcene',
+        group=BALANCED,
+        read_kwargs={'header': None, 'sep': ' ', 'usecols': range(1500)},
+        parts=[
+            'ARCENE/arcene_train.data',
+            'ARCENE/arcene_train.labels',
+            'ARCENE/arcene_valid.data',
+            'arcene_valid.labels',
+        ],
+        labels=True,
+    ),
+    DatasetSpec(
+        name='audit',
+        title='Audit',
+        url='https://archive.ics.uci.edu/ml/datasets/Audit+Data',
+        group=BALANCED,
+        reader='zipped_csv',
+        read_kwargs={
+            'member': 'audit_data/audit_risk.csv',
+            'usecols': _excluding('LOCATION_ID'),
+        },
+        target_col='Risk',
+    ),
+    DatasetSpec(
+        name='banknote_authentication',
+        title='Banknote Authentication',
+        url='https://archive.ics.uci.edu/ml/datasets/banknote+authentication',
+        group=BALANCED,
+        read_kwargs={'header': None},
+    ),
+    DatasetSpec(
+        name='breast_cancer',
+        title='Breast Cancer Wisconsin',
+        url='https://archive.ics.uci.edu/ml/datasets/Breast+Cancer+Wisconsin+(Diagnostic)',
+        group=BALANCED,
+        read_kwargs={'header': None, 'usecols': range(1, 32)},
+        target_col=1,
+        target_vals=['M'],
+    ),
+    DatasetSpec(
+        name='breast_tissue',
+        title='Breast Tissue',
+        url='http://archive.ics.uci.edu/ml/datasets/breast+tissue',
+        group=IMBALANCED,
+        reader='excel',
+        read_kwargs={'sheet_name': 'Data', 'usecols': _excluding('Case #')},
+        target_col='Class',
+        target_vals=['car', 'fad'],
+        factors=(1, 2, 3, 4),
+    ),
+    DatasetSpec(
+        name='census',
+        title='Census-Income (KDD)',
+        url='https://archive.ics.uci.edu/ml/datasets/Census-Income+(KDD)',
+        group=MIXED,
+        read_kwargs={'header': None, 'skipinitialspace': True, 'na_values': '?'},
+        target_vals=['50000+.'],
+        chunked=True,
+    ),
+    _keel(
+        'cleveland',
+        'Heart Disease Cleveland',
+        980,
+        'cleveland-0_vs_4.dat',
+        factors=(1,),
+    ),
+    DatasetSpec(
+        name='contraceptive',
+        title='Contraceptive Method Choice',
+        url='https://archive.ics.uci.edu/ml/datasets/Contraceptive+Method+Choice',
+        group=MIXED,
+        read_kwargs={'header': None},
+    ),
+    DatasetSpec(
+        name='covertype',
+        title='Covertype',
+        url='https://archive.ics.uci.edu/ml/datasets/Covertype',
+        group=MIXED,
+        read_kwargs={'header': None},
+        target_vals=[2],
+        chunked=True,
+    ),
+    DatasetSpec(
+        name='credit_approval',
+        title='Credit Approval',
+        url='https://archive.ics.uci.edu/ml/datasets/Credit+Approval',
+        group=MIXED,
+        read_kwargs={'header': None, 'na_values': '?'},
+    ),
+    _keel('dermatology', 'Dermatology', 1330, 'dermatology-6.dat', factors=(1, 2)),
+    DatasetSpec(
+        name='echocardiogram',
+        title='Echocardiogram',
+        url='https://archive.ics.uci.edu/ml/datasets/Echocardiogram',
+        group=MIXED,
+        read_kwargs={'header': None, 'on_bad_lines': 'skip', 'na_values': '?'},
+    ),
+    DatasetSpec(
+        name='ecoli',
+        title='Ecoli',
+        url='https://archive.ics.uci.edu/ml/datasets/ecoli',
+        group=IMBALANCED,
+        read_kwargs={
+            'header': None,
+            'delim_whitespace': True,
+            'usecols': range(1, 9),
+        },
+        target_col=8,
+        target_vals=['pp'],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='eucalyptus',
+        title='Eucalyptus',
+        url='https://www.openml.org/d/188',
+        group=IMBALANCED,
+        read_kwargs={
+            'na_values': '?',
+            'usecols': _excluding(
+                'Abbrev',
+                'Rep',
+                'Locality',
+                'Map_Ref',
+                'Latitude',
+                'Altitude',
+                'Frosts',
+                'Sp',
+                'PMCno',
+            ),
+        },
+        target_col='Utility',
+        target_vals=['best'],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='flags',
+        title='Flags',
+        url='https://archive.ics.uci.edu/ml/datasets/Flags',
+        group=MIXED,
+        read_kwargs={'header': None},
+    ),
+    DatasetSpec(
+        name='german_credit',
+        title='German Credit',
+        url='https://archive.ics.uci.edu/ml/datasets/Statlog+%28German+Credit+Data%29',
+        group=MIXED,
+        read_kwargs={'header': None, 'sep': ' '},
+    ),
+    DatasetSpec(
+        name='glass',
+        title='Glass Identification',
+        url='https://archive.ics.uci.edu/ml/datasets/glass+identification',
+        group=IMBALANCED,
+        read_kwargs={'header': None, 'usecols': range(1, 11)},
+        target_col=10,
+        target_vals=[1],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='haberman',
+        title='Haberman\'s Survival',
+        url='https://archive.ics.uci.edu/ml/datasets/Haberman\'s+Survival',
+        group=IMBALANCED,
+        read_kwargs={'header': None},
+        target_col=3,
+        target_vals=[2],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='heart',
+        title='Heart',
+        url='http://archive.ics.uci.edu/ml/datasets/statlog+(heart)',
+        group=IMBALANCED,
+        read_kwargs={'header': None, 'delim_whitespace': True},
+        target_vals=[2],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='heart_disease',
+        title='Heart Disease',
+        url='https://archive.ics.uci.edu/ml/datasets/Heart+Disease',
+        group=MIXED,
+        read_kwargs={'header': None, 'na_values': '?'},
+    ),
+    DatasetSpec(
+        name='hepatitis',
+        title='Hepatitis',
+        url='https://archive.ics.uci.edu/ml/datasets/Hepatitis',
+        group=MIXED,
+        read_kwargs={'header': None, 'na_values': '?'},
+    ),
+    DatasetSpec(
+        name='ionosphere',
+        title='Ionosphere',
+        url='https://archive.ics.uci.edu/ml/datasets/ionosphere',
+        group=BALANCED,
+        read_kwargs={'header': None, 'usecols': range(2, 35)},
+        target_vals=['b'],
+    ),
+    DatasetSpec(
+        name='iris',
+        title='Iris',
+        url='https://archive.ics.uci.edu/ml/datasets/iris',
+        group=IMBALANCED,
+        read_kwargs={'header': None},
+        target_vals=['Iris-setosa'],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    _keel(
+        'led',
+        'LED Display Domain',
+        998,
+        'led7digit-0-2-4-5-6-7-8-9_vs_1.dat',
+        factors=(1, 2, 3, 4),
+    ),
+    DatasetSpec(
+        name='libras',
+        title='Libras Movement',
+        url='https://archive.ics.uci.edu/ml/datasets/Libras+Movement',
+        group=IMBALANCED,
+        read_kwargs={'header': None},
+        target_vals=[1],
+        factors=(1, 2, 3),
+    ),
+    DatasetSpec(
+        name='liver',
+        title='Liver Disorders',
+        url='https://archive.ics.uci.edu/ml/datasets/liver+disorders',
+        group=IMBALANCED,
+        read_kwargs={'header': None},
+        target_vals=[1],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='madelon',
+        title='Madelon',
+        url='https://archive.ics.uci.edu/ml/datasets/Madelon',
+        group=IMBALANCED,
+        read_kwargs={'header': None, 'sep': ' ', 'usecols': range(500)},
+        parts=['madelon_train.data', 'madelon_train.labels'],
+        labels=True,
+        target_vals=[-1],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    _keel(
+        'new_thyroid_1',
+        'Thyroid 1 Disease',
+        145,
+        'new-thyroid1.dat',
+        factors=(1, 2, 3, 4),
+    ),
+    _keel(
+        'new_thyroid_2',
+        'Thyroid 2 Disease',
+        146,
+        'newthyroid2.dat',
+        factors=(1, 2, 3, 4),
+    ),
+    _keel(
+        'page_blocks_1_3',
+        'Page Blocks 1-3',
+        124,
+        'page-blocks-1-3_vs_4.dat',
+        factors=(1, 2, 3),
+    ),
+    DatasetSpec(
+        name='parkinsons',
+        title='Parkinsons',
+        url='https://archive.ics.uci.edu/ml/datasets/parkinsons',
+        group=BALANCED,
+        read_kwargs={'usecols': _excluding('name')},
+        target_col='status',
+        target_vals=[0],
+    ),
+    DatasetSpec(
+        name='pima',
+        title='Pima Indians Diabetes',
+        url='https://www.kaggle.com/uciml/pima-indians-diabetes-database',
+        group=IMBALANCED,
+        read_kwargs={'header': None, 'skiprows': 9},
+        factors=(1, 2, 3, 4, 5),
+    ),
+    DatasetSpec(
+        name='spambase',
+        title='Spambase',
+        url='https://archive.ics.uci.edu/ml/datasets/Spambase',
+        group=BALANCED,
+        read_kwargs={'header': None},
+    ),
+    DatasetSpec(
+        name='thyroid',
+        title='Thyroid Disease',
+        url='https://archive.ics.uci.edu/ml/datasets/Thyroid+Disease',
+        group=MIXED,
+        read_kwargs={'header': None, 'na_values': '?'},
+    ),
+    DatasetSpec(
+        name='vehicle',
+        title='Vehicle Silhouettes',
+        url='https://archive.ics.uci.edu/ml/datasets/Statlog+(Vehicle+Silhouettes)',
+        group=IMBALANCED,
+        read_kwargs={'header': None, 'delim_whitespace': True},
+        parts=[f'xa{letter}.dat' for letter in 'abcdefghi'],
+        target_col=18,
+        target_vals=['van'],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    _keel('vowel', 'Vowel Recognition', 127, 'vowel0.dat', factors=(1, 2, 3, 4, 5)),
+    DatasetSpec(
+        name='wine',
+        title='Wine',
+        url='https://archive.ics.uci.edu/ml/datasets/wine',
+        group=IMBALANCED,
+        read_kwargs={'header': None},
+        target_col=0,
+        target_vals=[2],
+        factors=(1, 2, 3, 4, 5),
+    ),
+    _keel('yeast_1', 'Yeast 1', 153, 'yeast1.dat', factors=(1, 2, 3, 4, 5)),
+]
+DATASETS = {spec.name: spec for spec in SPECS}
@@ -0,0 +1,451 @@
+"""Project runners."""
+
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import sys
+from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import lru_cache, partial
+from itertools import chain
+from pathlib import Path
+
+from kedro.framework.hooks.manager import (
+    _create_hook_manager,
+    _register_hooks,
+    _register_hooks_entry_points,
+)
+from kedro.framework.project import (
+    LOGGING,
+    PACKAGE_NAME,
+    configure_logging,
+    configure_project,
+    settings,
+)
+from kedro.io import DataCatalog, MemoryDataset, SharedMemoryDataset
+from kedro.runner import ParallelRunner, SequentialRunner
+from kedro.runner.task import Task
+
+from ._io import hash_file, write_json
+from .hooks import DownloadHooks
+
+MANIFEST_PATH = 'data/manifest.json'
+IO_BOUND_TAG = 'download'
+MAX_THREADS = 16
+MISSING = '<missing>'
+PROJECT_PACKAGE = __name__.split('.')[0]
+
+
+class _RecordingDict(dict):
+    """Parameters dictionary that records the paths of the accessed values.
+
+    Nested dictionaries are recorded key by key, while iterating over a dictionary
+    records it as a whole.
+    """
+
+    def __init__(self, data, accessed, path=()):
+        super().__init__(data)
+        self._accessed = accessed
+        self._path = path
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(value, dict):
+            return _RecordingDict(value, self._accessed, (*self._path, key))
+        self._accessed.add((*self._path, key))
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        self._accessed.add((*self._path, key))
+        return default
+
+    def __contains__(self, key):
+        self._accessed.add((*self._path, key))
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self._accessed.add(self._path)
+        return super().__iter__()
+
+    def keys(self):
+        self._accessed.add(self._path)
+        return super().keys()
+
+    def items(self):
+        self._accessed.add(self._path)
+        return super().items()
+
+    def values(self):
+        self._accessed.add(self._path)
+        return super().values()
+
+
+def _resolve(params, path):
+    value = params
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return MISSING
+        value = value[key]
+    return value
+
+
+def _imported_modules(module):
+    """Return the names of the project modules imported by a module."""
+    names = set()
+    for statement in ast.walk(ast.parse(inspect.getsource(module))):
+        if isinstance(statement, ast.Import):
+            names.update(alias.name for alias in statement.names)
+        elif isinstance(statement, ast.ImportFrom):
+            base = importlib.util.resolve_name(
+                '.' * statement.level + (statement.module or ''), module.__package__
+            )
+            names.add(base)
+            names.update(f'{base}.{alias.name}' for alias in statement.names)
+    return sorted(
+        name
+        for name in names
+        if name in sys.modules
+        and (name == PROJECT_PACKAGE or name.startswith(f'{PROJECT_PACKAGE}.'))
+    )
+
+
+@lru_cache
+def _module_sources(name):
+    """Return the sources of a module and of the project modules it imports.
+
+    The project modules are followed transitively, so that a node is run again when
+    any code it may call changes, and the sources are sorted by module name.
+    """
+    sources = {}
+    pending = [name]
+    while pending:
+        name = pending.pop()
+        if name in sources:
+            continue
+        module = sys.modules[name]
+        sources[name] = inspect.getsource(module)
+        pending.extend(_imported_modules(module))
+    return [[name, sources[name]] for name in sorted(sources)]
+
+
+def _stable_repr(obj):
+    """Return a representation of an object that does not vary between runs."""
+    if isinstance(obj, partial):
+        return [
+            _stable_repr(obj.func),
+            _stable_repr(obj.args),
+            _stable_repr(obj.keywords),
+        ]
+    if inspect.isfunction(obj):
+        closure = [cell.cell_contents for cell in obj.__closure__ or ()]
+        return [_module_sources(obj.__module__), _stable_repr(closure)]
+    if isinstance(obj, dict):
+        return {str(key): _stable_repr(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_stable_repr(value) for value in obj]
+    if hasattr(obj, '__dataclass_fields__'):
+        return {
+            name: _stable_repr(getattr(obj, name)) for name in obj.__dataclass_fields__
+        }
+    return repr(obj)
+
+
+def _digest(obj):
+    return hashlib.sha256(
+        json.dumps(obj, sort_keys=True, default=repr).encode()
+    ).hexdigest()
+
+
+class IncrementalRunner(SequentialRunner):
+    """Sequential runner that skips the nodes whose fingerprint has not changed.
+
+    The fingerprint of a node combines the source code of the module of its function
+    and of the project modules it imports transitively, the values of the
+    parameters it accessed during its last run, the contents of its input files and
+    the definitions of its output datasets. The fingerprints are recorded in a
+    manifest after every node, and a node is skipped when its fingerprint is
+    unchanged and all its outputs exist. Nodes with inputs that are not stored in
+    files are always run. Downloaded files are assumed not to change for the same
+    URL, since the downloading nodes are skipped as long as their URLs are the same.
+    """
+
+    def __init__(self, is_async=False, extra_dataset_patterns=None):
+        super().__init__(
+            is_async=is_async, extra_dataset_patterns=extra_dataset_patterns
+        )
+        self._manifest_path = Path(MANIFEST_PATH)
+
+    def _read_manifest(self):
+        try:
+            return json.loads(self._manifest_path.read_text())
+        except FileNotFoundError:
+            return {'nodes': {}, 'files': {}}
+
+    def _write_manifest(self, manifest):
+        self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self._manifest_path, manifest)
+
+    @staticmethod
+    def _hash_file(path, files):
+        stat = path.stat()
+        key = str(path)
+        if key in files and files[key][:2] == [stat.st_size, stat.st_mtime_ns]:
+            return files[key][2]
+        files[key] = [stat.st_size, stat.st_mtime_ns, hash_file(path)]
+        return files[key][2]
+
+    def _hash_dataset(self, catalog, name, files):
+        """Return the hash of the files of a dataset or ``None`` if not stored."""
+        filepath = getattr(catalog._get_dataset(name), '_filepath', None)
+        if filepath is None or not Path(filepath).exists():
+            return None
+        filepath = Path(filepath)
+        paths = sorted(filepath.rglob('*')) if filepath.is_dir() else [filepath]
+        return [self._hash_file(path, files) for path in paths if path.is_file()]
+
+    def _fingerprint(self, node, catalog, manifest, accessed):
+        inputs = {}
+        for name in node.inputs:
+            if name == 'parameters':
+                params = catalog.load(name)
+                inputs[name] = [
+                    [list(path), _resolve(params, path)] for path in accessed
+                ]
+            elif name.startswith('params:'):
+                inputs[name] = catalog.load(name)
+            else:
+                inputs[name] = self._hash_dataset(catalog, name, manifest['files'])
+                if inputs[name] is None:
+                    return None
+        outputs = {name: str(catalog._get_dataset(name)) for name in node.outputs}
+        return _digest([_stable_repr(node.func), inputs, outputs])
+
+    def _is_up_to_date(self, node, catalog, manifest):
+        entry = manifest['nodes'].get(node.name)
+        if entry is None or not all(catalog.exists(name) for name in node.outputs):
+            return False
+        accessed = sorted(tuple(path) for path in entry['parameters'])
+        return (
+            self._fingerprint(node, catalog, manifest, accessed) == entry['fingerprint']
+        )
+
+    def _skip_downloads(self, nodes, catalog, manifest, hook_manager):
+        """Return the up-to-date downloading nodes, whose files are not prefetched.
+
+        The downloading nodes only depend on the parameters, so they are checked
+        before the run.
+        """
+        skipped = {
+            node
+            for node in nodes
+            if IO_BOUND_TAG in node.tags
+            and self._is_up_to_date(node, catalog, manifest)
+        }
+        if hook_manager is not None:
+            for plugin in hook_manager.get_plugins():
+                if isinstance(plugin, DownloadHooks):
+                    plugin.skip(skipped)
+        return skipped
+
+    def _run(self, pipeline, catalog, hook_manager=None, session_id=None):
+        nodes = pipeline.nodes
+        self._validate_catalog(catalog, pipeline)
+        self._validate_nodes(nodes)
+        self._set_manager_datasets(catalog, pipeline)
+        load_counts = Counter(chain.from_iterable(node.inputs for node in nodes))
+        manifest = self._read_manifest()
+        skipped = self._skip_downloads(nodes, catalog, manifest, hook_manager)
+        done_nodes = set()
+        for node in nodes:
+            if node in skipped or (
+                IO_BOUND_TAG not in node.tags
+                and self._is_up_to_date(node, catalog, manifest)
+            ):
+                self._logger.info('Skipped up-to-date node: %s', node.name)
+            else:
+                accessed = set()
+                if 'parameters' in node.inputs:
+                    params = catalog.load('parameters')
+                    catalog.add(
+                        'parameters',
+                        MemoryDataset(
+                            _RecordingDict(params, accessed), copy_mode='assign'
+                        ),
+                        replace=True,
+                    )
+                try:
+                    Task(
+                        node=node,
+                        catalog=catalog,
+                        hook_manager=hook_manager,
+                        is_async=self._is_async,
+                        session_id=session_id,
+                    ).execute()
+                except Exception:
+                    self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                    raise
+                finally:
+                    if 'parameters' in node.inputs:
+                        catalog.add('parameters', MemoryDataset(params), replace=True)
+                accessed = sorted(accessed)
+                fingerprint = self._fingerprint(node, catalog, manifest, accessed)
+                if fingerprint is None:
+                    manifest['nodes'].pop(node.name, None)
+                else:
+                    manifest['nodes'][node.name] = {
+                        'fingerprint': fingerprint,
+                        'parameters': [list(path) for path in accessed],
+                    }
+                self._write_manifest(manifest)
+                self._logger.info('Completed node: %s', node.name)
+            done_nodes.add(node)
+            self._logger.info(
+                'Completed %d out of %d tasks', len(done_nodes), len(nodes)
+            )
+            self._release_datasets(node, catalog, load_counts, pipeline)
+
+
+def _fresh_copy(dataset):
+    """Return a new instance of a dataset built from the arguments of its constructor.
+
+    Memory datasets are returned as they are, since they hold the data of the run.
+    """
+    if isinstance(dataset, (MemoryDataset, SharedMemoryDataset)):
+        return dataset
+    parameters = inspect.signature(type(dataset).__init__).parameters
+    args, kwargs = [], {}
+    for name, value in dataset._init_args.items():
+        kind = parameters[name].kind
+        if kind == inspect.Parameter.VAR_POSITIONAL:
+            args.extend(value)
+        elif kind == inspect.Parameter.VAR_KEYWORD:
+            kwargs.update(value)
+        else:
+            kwargs[name] = value
+    return type(dataset)(*args, **kwargs)
+
+
+def _node_catalog(catalog, node):
+    """Return a catalog of fresh copies of the datasets of a node.
+
+    Datasets cache unpicklable objects once they are accessed, such as the
+    partitions listed by a ``PartitionedDataset``, so the catalog sent to a process
+    only holds the datasets of its node, rebuilt without their caches.
+    """
+    return DataCatalog(
+        {
+            name: _fresh_copy(catalog._get_dataset(name))
+            for name in node.inputs + node.outputs
+        }
+    )
+
+
+def _run_in_subprocess(task, package_name, logging_config):
+    """Run a task in a spawned process with the project hooks.
+
+    Kedro only configures the project in the processes it spawns when spawning is
+    the default start method, so the processes are configured here instead.
+    """
+    configure_project(package_name)
+    configure_logging(logging_config)
+    task.hook_manager = _create_hook_manager()
+    _register_hooks(task.hook_manager, settings.HOOKS)
+    _register_hooks_entry_points(task.hook_manager, settings.DISABLE_HOOKS_FOR_PLUGINS)
+    return task.execute()
+
+
+class HybridRunner(ParallelRunner):
+    """Parallel runner that runs the I/O-bound nodes in threads.
+
+    The nodes tagged as ``'download'`` run in a pool of threads of the main
+    process, while the CPU-bound transformation and processing nodes run in a pool
+    of processes, which are sent catalogs of only the datasets of their nodes.
+    """
+
+    def __init__(
+        self,
+        max_workers=None,
+        max_threads=MAX_THREADS,
+        is_async=False,
+        extra_dataset_patterns=None,
+    ):
+        super().__init__(
+            max_workers=max_workers,
+            is_async=is_async,
+            extra_dataset_patterns=extra_dataset_patterns,
+        )
+        self._max_threads = max_threads
+
+    def _run(self, pipeline, catalog, hook_manager=None, session_id=None):
+        nodes = pipeline.nodes
+        self._validate_catalog(catalog, pipeline)
+        self._validate_nodes([node for node in nodes if IO_BOUND_TAG not in node.tags])
+        self._set_manager_datasets(catalog, pipeline)
+        load_counts = Counter(chain.from_iterable(node.inputs for node in nodes))
+        node_dependencies = pipeline.node_dependencies
+        todo_nodes = set(node_dependencies)
+        done_nodes = set()
+        futures = set()
+        done = None
+        max_workers = self._get_required_workers_count(pipeline)
+        # Processes are spawned, since forking while the threads hold locks could
+        # deadlock the children.
+        mp_context = multiprocessing.get_context('spawn')
+        with ThreadPoolExecutor(self._max_threads) as threads, ProcessPoolExecutor(
+            max_workers,
+            mp_context=mp_context,
+        ) as processes:
+            while True:
+                ready = {
+                    node for node in todo_nodes if node_dependencies[node] <= done_nodes
+                }
+                todo_nodes -= ready
+                for node in ready:
+                    if IO_BOUND_TAG in node.tags:
+                        task = Task(
+                            node=node,
+                            catalog=catalog,
+                            hook_manager=hook_manager,
+                            is_async=self._is_async,
+                            session_id=session_id,
+                        )
+                        futures.add(threads.submit(task))
+                    else:
+                        task = Task(
+                            node=node,
+                            catalog=_node_catalog(catalog, node),
+                            is_async=self._is_async,
+                            session_id=session_id,
+                        )
+                        futures.add(
+                            processes.submit(
+                                _run_in_subprocess, task, PACKAGE_NAME, dict(LOGGING)
+                            )
+                        )
+                if not futures:
+                    if todo_nodes:
+                        self._raise_runtime_error(todo_nodes, done_nodes, ready, done)
+                    break
+                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        node = future.result()
+                    except Exception:
+                        self._suggest_resume_scenario(pipeline, done_nodes, catalog)
+                        raise
+                    done_nodes.add(node)
+                    self._logger.info('Completed node: %s', node.name)
+                    self._logger.info(
+                        'Completed %d out of %d tasks', len(done_nodes), len(nodes)
+                    )
+                    self._release_datasets(node, catalog, load_counts, pipeline)
@@ -0,0 +1,20 @@
+"""Project session store."""
+
+from kedro.framework.session.store import BaseSessionStore
+
+
+class SQLiteStore(BaseSessionStore):
+    """Session store saving the sessions with the Kedro-Viz SQLite store.
+
+    The Kedro-Viz store, which imports SQLAlchemy, is only imported when a session
+    is saved, so that the commands that do not run a session start faster.
+    """
+
+    def save(self):
+        from kedro_viz.integrations.kedro.sqlite_store import (
+            SQLiteStore as VizSQLiteStore,
+        )
+
+        store = VizSQLiteStore(self._path, self._session_id)
+        store.update(self.data)
+        store.save()
@@ -2,24 +2,31 @@
 from the Kedro defaults. For further information, including these default values, see
 https://docs.kedro.org/en/stable/kedro_project_setup/settings.html."""
 
+from pathlib import Path
+
 # Instantiated project hooks.
-# For example, after creating a hooks.py and defining a ProjectHooks class there, do
-# from pandas_viz.hooks import ProjectHooks
+from ial_datasets.hooks import DownloadHooks, InstrumentationHooks  # noqa: E402
+
+PROJECT_PATH = Path(__file__).parents[2]
 
 # Hooks are executed in a Last-In-First-Out (LIFO) order.
-# HOOKS = (ProjectHooks(),)
+HOOKS = (
+    DownloadHooks(),
+    InstrumentationHooks(
+        db_path=PROJECT_PATH / "session_store.db",
+        metrics_path=PROJECT_PATH / "data" / "metrics.prom",
+    ),
+)
 
 # Installed plugins for which to disable hook auto-registration.
 # DISABLE_HOOKS_FOR_PLUGINS = ("kedro-viz",)
 
 # Class that manages storing KedroSession data.
-from pathlib import Path  # noqa: E402
-
-from kedro_viz.integrations.kedro.sqlite_store import SQLiteStore  # noqa: E402
+from ial_datasets.session_store import SQLiteStore  # noqa: E402
 
 SESSION_STORE_CLASS = SQLiteStore
 # Keyword arguments to pass to the `SESSION_STORE_CLASS` constructor.
-SESSION_STORE_ARGS = {"path": str(Path(__file__).parents[2])}
+SESSION_STORE_ARGS = {"path": str(PROJECT_PATH)}
 
 # Directory that holds configuration.
 # CONF_SOURCE = "conf"
@@ -1,21 +1,59 @@
 """Utility functions."""
 
+import numpy as np
 import pandas as pd
 
+from .metadata import describe
+
+DEFAULT_DTYPES = {'features': 'float64', 'target': 'int64'}
+
 
 def transform_numeric_features_binary_target(
-    data, drop_cols=None, target_col=None, target_vals=None
+    data, drop_cols=None, target_col=None, target_vals=None, dtypes=None
 ):
+    """Convert the features of a dataset to floats and its target to a binary one.
+
+    The features are selected and converted to floats in a single array, which backs
+    the returned frame, and the rows with missing features are dropped with a mask
+    computed in one vectorized pass. The ``features`` and ``target`` entries of
+    ``dtypes`` set the dtypes of the features and the target, by default ``float64``
+    and ``int64``.
+
+    Returns:
+        A frame of the features, labelled by their positions, and the ``target``.
+    """
     if drop_cols is None:
         drop_cols = []
     if target_col is None:
         target_col = data.columns[-1]
     if target_vals is None:
         target_vals = [1]
-    y = data[target_col].rename('target').isin(target_vals).astype(int)
-    X = data.drop(columns=[target_col] + list(drop_cols)).astype(float)
-    columns_mapping = dict(zip(X.columns, range(X.shape[1])))
-    X = X.rename(columns=columns_mapping)
-    data = pd.concat([X, y], axis=1)
-    data = data.dropna()
+    dtypes = {**DEFAULT_DTYPES, **(dtypes or {})}
+    drop_cols = {target_col, *drop_cols}
+    positions = [i for i, col in enumerate(data.columns) if col not in drop_cols]
+    # Contiguous features are selected as a slice, which does not copy them.
+    if positions and positions == list(range(positions[0], positions[-1] + 1)):
+        positions = slice(positions[0], positions[-1] + 1)
+    # Missing values of nullable columns, such as the Int64 columns of the KEEL
+    # reader, are converted to NaN as well.
+    X = data.iloc[:, positions].to_numpy(dtype=dtypes['features'], na_value=np.nan)
+    y = data[target_col].isin(target_vals).to_numpy().astype(dtypes['target'])
+    index = data.index
+    missing = np.isnan(X).any(axis=1)
+    if missing.any():
+        X, y, index = X[~missing], y[~missing], index[~missing]
+    data = pd.DataFrame(X, index=index, copy=False)
+    data['target'] = y
     return data
+
+
+def transform_and_describe(data, spec, dtypes=None):
+    """Transform a dataset with ``transform_numeric_features_binary_target``.
+
+    Returns:
+        The transformed data and its metadata.
+    """
+    data = transform_numeric_features_binary_target(
+        data, target_col=spec.target_col, target_vals=spec.target_vals, dtypes=dtypes
+    )
+    return data, describe(data, spec)
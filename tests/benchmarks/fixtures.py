@@ -0,0 +1,546 @@
+"""Writers of the fixture files served to the downloading nodes.
+
+The files have the layout, shape and value types of the original sources, with
+random values generated from a fixed seed. Every writer returns the expected outputs
+of the nodes of its dataset.
+"""
+
+import gzip
+import io
+from functools import partial
+from typing import NamedTuple, Optional
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import numpy as np
+import pandas as pd
+
+# Fraction of the rows with a missing value in the datasets that have some.
+MISSING_RATE = 0.1
+URLS = {
+    'eucalyptus': 'openml/dataset_194_eucalyptus.csv',
+    'pima': 'gist/pima-indians-diabetes.csv',
+}
+EUCALYPTUS_COLUMNS = [
+    'Abbrev',
+    'Rep',
+    'Locality',
+    'Map_Ref',
+    'Latitude',
+    'Altitude',
+    'Rainfall',
+    'Frosts',
+    'Year',
+    'Sp',
+    'PMCno',
+    'DBH',
+    'Ht',
+    'Surv',
+    'Vig',
+    'Ins_res',
+    'Stem_Fm',
+    'Crown_Fm',
+    'Brnch_Fm',
+    'Utility',
+]
+BREAST_TISSUE_FEATURES = [
+    'I0',
+    'PA500',
+    'HFS',
+    'DA',
+    'Area',
+    'A/DA',
+    'Max IP',
+    'DR',
+    'P',
+]
+PARKINSONS_FEATURES = [f'MDVP:{i}' for i in range(22)]
+
+
+class Expected(NamedTuple):
+    """Expected outputs of the nodes of a dataset.
+
+    Args:
+        shape: Shape of the downloaded data.
+        X: Features of the rows without missing values, or ``None`` if they are not
+            all numerical.
+        y: Binary target of the rows without missing values.
+    """
+
+    shape: tuple
+    X: Optional[np.ndarray]
+    y: np.ndarray
+
+
+def _expected(n_columns, X, labels, positives):
+    complete = ~np.isnan(X).any(axis=1)
+    y = np.isin(labels, positives).astype(int)
+    return Expected((len(X), n_columns), X[complete], y[complete])
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _write_bytes(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _zip(member, text):
+    buffer = io.BytesIO()
+    with ZipFile(buffer, 'w', ZIP_DEFLATED) as archive:
+        archive.writestr(member, text)
+    return buffer.getvalue()
+
+
+def _lines(rows, sep=',', end='\n'):
+    return ''.join(sep.join(map(str, row)) + end for row in rows)
+
+
+def _cells(X, missing='?', integer=False):
+    """Return the rows of a features matrix as strings, with missing values."""
+    return [
+        [
+            missing if np.isnan(value) else str(int(value) if integer else value)
+            for value in row
+        ]
+        for row in X
+    ]
+
+
+def _with_missing(rng, X):
+    """Set a value of a fraction of the rows of a features matrix to NaN."""
+    X = X.astype(float)
+    rows = np.flatnonzero(rng.random(len(X)) < MISSING_RATE)
+    X[rows, rng.integers(0, X.shape[1], rows.size)] = np.nan
+    return X
+
+
+def _rows(X, labels, first=False):
+    if first:
+        return [[label, *row] for row, label in zip(X, labels)]
+    return [[*row, label] for row, label in zip(X, labels)]
+
+
+def _write_arcene(root, rng):
+    X_parts, y_parts = [], []
+    for part in ('train', 'valid'):
+        X = rng.integers(0, 1000, (100, 10000))
+        _write(
+            root / 'arcene' / 'ARCENE' / f'arcene_{part}.data', _lines(X, ' ', ' \n')
+        )
+        X_parts.append(X[:, :1500])
+    for part, folder in (('train', 'ARCENE/'), ('valid', '')):
+        y = rng.choice([-1, 1], (100, 1))
+        _write(root / 'arcene' / folder / f'arcene_{part}.labels', _lines(y))
+        y_parts.append(y[:, 0])
+    return _expected(1501, np.vstack(X_parts), np.concatenate(y_parts), [1])
+
+
+def _write_audit(root, rng):
+    columns = ['Sector_score', 'LOCATION_ID', *[f'X{i}' for i in range(24)], 'Risk']
+    sector_scores = np.round(rng.random(776) * 10, 2)
+    location_ids = rng.integers(1, 45, 776)
+    X = np.round(rng.random((776, 24)), 3)
+    labels = rng.integers(0, 2, 776)
+    rows = [
+        [score, location_id, *row, label]
+        for score, location_id, row, label in zip(
+            sector_scores, location_ids, X, labels
+        )
+    ]
+    _write_bytes(
+        root / '00475' / 'audit_data.zip',
+        _zip('audit_data/audit_risk.csv', ','.join(columns) + '\n' + _lines(rows)),
+    )
+    return _expected(26, np.column_stack([sector_scores, X]), labels, [1])
+
+
+def _write_banknote_authentication(root, rng):
+    X = np.round(rng.normal(0, 5, (400, 4)), 4)
+    labels = rng.integers(0, 2, 400)
+    _write(
+        root / '00267' / 'data_banknote_authentication.txt',
+        _lines(_rows(X, labels)),
+    )
+    return _expected(5, X, labels, [1])
+
+
+def _write_breast_cancer(root, rng):
+    X = np.round(rng.random((300, 30)) * 100, 3)
+    labels = rng.choice(['M', 'B'], 300, p=[0.37, 0.63])
+    rows = [[842302 + i, label, *row] for i, (row, label) in enumerate(zip(X, labels))]
+    _write(root / 'breast-cancer-wisconsin' / 'wdbc.data', _lines(rows))
+    return _expected(31, X, labels, ['M'])
+
+
+def _write_breast_tissue(root, rng):
+    X = np.round(rng.random((106, 9)) * 1000, 3)
+    labels = rng.choice(['car', 'fad', 'mas', 'gla', 'con', 'adi'], 106)
+    data = pd.DataFrame(X, columns=BREAST_TISSUE_FEATURES)
+    data.insert(0, 'Class', labels)
+    data.insert(0, 'Case #', range(1, 107))
+    buffer = io.BytesIO()
+    # The file is read by its content, so an Excel 2007 workbook is served in place
+    # of the original Excel 97 one.
+    data.to_excel(buffer, sheet_name='Data', index=False)
+    _write_bytes(root / '00192' / 'BreastTissue.xls', buffer.getvalue())
+    return _expected(10, X, labels, ['car', 'fad'])
+
+
+def _write_census(root, rng):
+    n_rows = 2000
+    columns = []
+    for i in range(41):
+        if i % 3 == 0:
+            columns.append(rng.integers(0, 100, n_rows).astype(str))
+        else:
+            values = rng.choice(
+                ['Private', 'Self-employed', 'Not in universe', '?'], n_rows
+            )
+            columns.append(values)
+    labels = rng.choice(['- 50000.', '50000+.'], n_rows, p=[0.94, 0.06])
+    rows = [[*row, label] for row, label in zip(zip(*columns), labels)]
+    _write_bytes(
+        root / 'census-income-mld' / 'census-income.data.gz',
+        gzip.compress(_lines(rows, ', ').encode()),
+    )
+    return Expected((n_rows, 42), None, np.isin(labels, ['50000+.']).astype(int))
+
+
+def _write_covertype(root, rng):
+    X = np.column_stack(
+        [rng.integers(1800, 3900, (3000, 10)), rng.integers(0, 2, (3000, 44))]
+    )
+    labels = rng.integers(1, 8, 3000)
+    _write_bytes(
+        root / 'covtype' / 'covtype.data.gz',
+        gzip.compress(_lines(_rows(X, labels)).encode()),
+    )
+    return _expected(55, X.astype(float), labels, [2])
+
+
+def _write_ecoli(root, rng):
+    X = np.round(rng.random((336, 7)), 2)
+    labels = rng.choice(['cp', 'im', 'pp', 'imU', 'om'], 336)
+    rows = [[f'SEQ{i}_ECOLI', *row] for i, row in enumerate(_rows(X, labels))]
+    _write(root / 'ecoli' / 'ecoli.data', _lines(rows, '  '))
+    return _expected(8, X, labels, ['pp'])
+
+
+def _write_eucalyptus(root, rng):
+    n_rows = 736
+    X = np.column_stack(
+        [
+            rng.integers(600, 1500, n_rows),
+            np.full(n_rows, 1980),
+            rng.integers(5, 30, (n_rows, 2)),
+            rng.integers(0, 100, n_rows),
+            np.round(rng.random((n_rows, 5)) * 5, 1),
+        ]
+    )
+    # Only the measurements, after the rainfall and the year, have missing values.
+    X[:, 2:] = _with_missing(rng, X[:, 2:])
+    labels = rng.choice(['none', 'low', 'average', 'good', 'best'], n_rows)
+    rows = [
+        [
+            'Co',
+            rng.integers(1, 6),
+            'Central_Hawkes_Bay',
+            'N135_382/137',
+            '39__38',
+            100,
+            rainfall,
+            -2,
+            year,
+            'co',
+            1520,
+            *measurements,
+            label,
+        ]
+        for (rainfall, year, *measurements), label in zip(_cells(X), labels)
+    ]
+    _write(
+        root / URLS['eucalyptus'], ','.join(EUCALYPTUS_COLUMNS) + '\n' + _lines(rows)
+    )
+    return _expected(11, X, labels, ['best'])
+
+
+def _write_glass(root, rng):
+    X = np.round(rng.random((214, 9)) * 10, 5)
+    labels = rng.integers(1, 8, 214)
+    rows = [[i + 1, *row] for i, row in enumerate(_rows(X, labels))]
+    _write(root / 'glass' / 'glass.data', _lines(rows))
+    return _expected(10, X, labels, [1])
+
+
+def _write_haberman(root, rng):
+    X = np.column_stack(
+        [
+            rng.integers(30, 84, 306),
+            rng.integers(58, 70, 306),
+            rng.integers(0, 53, 306),
+        ]
+    )
+    labels = rng.choice([1, 2], 306, p=[0.74, 0.26])
+    _write(root / 'haberman' / 'haberman.data', _lines(_rows(X, labels)))
+    return _expected(4, X.astype(float), labels, [2])
+
+
+def _write_heart(root, rng):
+    X = np.round(rng.random((270, 13)) * 200, 1)
+    labels = rng.choice([1, 2], 270, p=[0.56, 0.44])
+    _write(root / 'statlog' / 'heart' / 'heart.dat', _lines(_rows(X, labels), ' '))
+    return _expected(14, X, labels, [2])
+
+
+def _write_ionosphere(root, rng):
+    X = np.round(rng.random((351, 34)) * 2 - 1, 5)
+    X[:, 0] = 1
+    X[:, 1] = 0
+    labels = rng.choice(['g', 'b'], 351, p=[0.64, 0.36])
+    _write(root / 'ionosphere' / 'ionosphere.data', _lines(_rows(X, labels)))
+    return _expected(33, X[:, 2:], labels, ['b'])
+
+
+def _write_iris(root, rng):
+    X = np.round(rng.random((150, 4)) * 7, 1)
+    labels = np.repeat(['Iris-setosa', 'Iris-versicolor', 'Iris-virginica'], 50)
+    _write(root / 'iris' / 'bezdekIris.data', _lines(_rows(X, labels)) + '\n')
+    return _expected(5, X, labels, ['Iris-setosa'])
+
+
+class KeelFixture(NamedTuple):
+    """Layout of the fixture of a dataset of the KEEL repository."""
+
+    path: str
+    member: str
+    n_rows: int
+    n_features: int
+    integer: bool = False
+    missing: bool = False
+
+
+def _write_keel(root, rng, fixture):
+    """Write a dataset of the KEEL repository, as a ZIP archive of a KEEL file."""
+    path, member, n_rows, n_features, integer, missing = fixture
+    attributes = [f'A{i}' for i in range(n_features)]
+    if integer:
+        X = rng.integers(0, 4, (n_rows, n_features)).astype(float)
+        types = ['integer[0,3]'] * n_features
+    else:
+        X = np.round(rng.random((n_rows, n_features)) * 10, 2)
+        types = ['real[0.0,10.0]'] * n_features
+    if missing:
+        X = _with_missing(rng, X)
+    labels = rng.choice(['positive', 'negative'], n_rows, p=[0.1, 0.9])
+    header = [f'@relation {member.removesuffix(".dat")}']
+    header += [f'@attribute {name} {type_}' for name, type_ in zip(attributes, types)]
+    header += [
+        '@attribute Class {positive, negative}',
+        f'@inputs {", ".join(attributes)}',
+        '@outputs Class',
+        '@data',
+    ]
+    rows = _rows(_cells(X, '<null>', integer), labels)
+    _write_bytes(
+        root / 'keel' / path,
+        _zip(member, '\n'.join(header) + '\n' + _lines(rows, ', ')),
+    )
+    return _expected(n_features + 1, X, labels, ['positive'])
+
+
+def _write_libras(root, rng):
+    X = np.round(rng.random((360, 90)), 5)
+    labels = rng.integers(1, 16, 360)
+    _write(root / 'libras' / 'movement_libras.data', _lines(_rows(X, labels)))
+    return _expected(91, X, labels, [1])
+
+
+def _write_liver(root, rng):
+    X = np.column_stack([rng.integers(60, 100, (345, 5)), rng.integers(0, 40, 345) / 2])
+    labels = rng.choice([1, 2], 345, p=[0.42, 0.58])
+    rows = [[*map(int, row[:5]), row[5], label] for row, label in zip(X, labels)]
+    _write(root / 'liver-disorders' / 'bupa.data', _lines(rows))
+    return _expected(7, X, labels, [1])
+
+
+def _write_madelon(root, rng):
+    X = rng.integers(400, 600, (2000, 500))
+    _write(root / 'madelon' / 'MADELON' / 'madelon_train.data', _lines(X, ' ', ' \n'))
+    y = rng.choice([-1, 1], (2000, 1))
+    _write(root / 'madelon' / 'MADELON' / 'madelon_train.labels', _lines(y))
+    return _expected(501, X.astype(float), y[:, 0], [-1])
+
+
+def _write_parkinsons(root, rng):
+    X = np.round(rng.random((195, 22)) * 100, 5)
+    labels = rng.choice([0, 1], 195, p=[0.25, 0.75])
+    columns = ['name', *PARKINSONS_FEATURES[:16], 'status', *PARKINSONS_FEATURES[16:]]
+    rows = [
+        [f'phon_R01_S{i:03d}', *row[:16], label, *row[16:]]
+        for i, (row, label) in enumerate(zip(X, labels))
+    ]
+    _write(
+        root / 'parkinsons' / 'parkinsons.data', ','.join(columns) + '\n' + _lines(rows)
+    )
+    return _expected(23, X, labels, [0])
+
+
+def _write_pima(root, rng):
+    X = np.column_stack(
+        [rng.integers(0, 200, (768, 5)), np.round(rng.random((768, 2)) * 50, 1)]
+    )
+    X = np.column_stack([X, rng.integers(21, 81, 768)])
+    labels = rng.choice([0, 1], 768, p=[0.65, 0.35])
+    rows = [
+        [*map(int, row[:5]), *row[5:7], int(row[7]), label]
+        for row, label in zip(X, labels)
+    ]
+    header = ''.join(f'# {i}. Attribute {i}\n' for i in range(1, 10))
+    _write(root / URLS['pima'], header + _lines(rows))
+    return _expected(9, X, labels, [1])
+
+
+def _write_spambase(root, rng):
+    X = np.round(rng.random((600, 57)) * 5, 3)
+    labels = rng.choice([0, 1], 600, p=[0.6, 0.4])
+    _write(root / 'spambase' / 'spambase.data', _lines(_rows(X, labels)))
+    return _expected(58, X, labels, [1])
+
+
+def _write_vehicle(root, rng):
+    X_parts, labels_parts = [], []
+    for letter in 'abcdefghi':
+        X = rng.integers(0, 300, (94, 18))
+        labels = rng.choice(['van', 'saab', 'bus', 'opel'], 94)
+        _write(
+            root / 'statlog' / 'vehicle' / f'xa{letter}.dat',
+            _lines(_rows(X, labels), ' '),
+        )
+        X_parts.append(X)
+        labels_parts.append(labels)
+    return _expected(
+        19, np.vstack(X_parts).astype(float), np.concatenate(labels_parts), ['van']
+    )
+
+
+def _write_wine(root, rng):
+    X = np.round(rng.random((178, 13)) * 20, 2)
+    labels = rng.integers(1, 4, 178)
+    _write(root / 'wine' / 'wine.data', _lines(_rows(X, labels, first=True)))
+    return _expected(14, X, labels, [2])
+
+
+WRITERS = {
+    'arcene': _write_arcene,
+    'audit': _write_audit,
+    'banknote_authentication': _write_banknote_authentication,
+    'breast_cancer': _write_breast_cancer,
+    'breast_tissue': _write_breast_tissue,
+    'census': _write_census,
+    'cleveland': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRhigherThan9p2/cleveland-0_vs_4.zip',
+            member='cleveland-0_vs_4.dat',
+            n_rows=173,
+            n_features=13,
+            missing=True,
+        ),
+    ),
+    'covertype': _write_covertype,
+    'dermatology': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRhigherThan9p3/dermatology-6.zip',
+            member='dermatology-6.dat',
+            n_rows=358,
+            n_features=34,
+            integer=True,
+            missing=True,
+        ),
+    ),
+    'ecoli': _write_ecoli,
+    'eucalyptus': _write_eucalyptus,
+    'glass': _write_glass,
+    'haberman': _write_haberman,
+    'heart': _write_heart,
+    'ionosphere': _write_ionosphere,
+    'iris': _write_iris,
+    'led': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRhigherThan9p2/led7digit-0-2-4-5-6-7-8-9_vs_1.zip',
+            member='led7digit-0-2-4-5-6-7-8-9_vs_1.dat',
+            n_rows=443,
+            n_features=7,
+            integer=True,
+        ),
+    ),
+    'libras': _write_libras,
+    'liver': _write_liver,
+    'madelon': _write_madelon,
+    'new_thyroid_1': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRlowerThan9/new-thyroid1.zip',
+            member='new-thyroid1.dat',
+            n_rows=215,
+            n_features=5,
+        ),
+    ),
+    'new_thyroid_2': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRlowerThan9/new-thyroid2.zip',
+            member='newthyroid2.dat',
+            n_rows=215,
+            n_features=5,
+        ),
+    ),
+    'page_blocks_1_3': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRhigherThan9p1/page-blocks-1-3_vs_4.zip',
+            member='page-blocks-1-3_vs_4.dat',
+            n_rows=472,
+            n_features=10,
+        ),
+    ),
+    'parkinsons': _write_parkinsons,
+    'pima': _write_pima,
+    'spambase': _write_spambase,
+    'vehicle': _write_vehicle,
+    'vowel': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRhigherThan9p1/vowel0.zip',
+            member='vowel0.dat',
+            n_rows=988,
+            n_features=13,
+        ),
+    ),
+    'wine': _write_wine,
+    'yeast_1': partial(
+        _write_keel,
+        fixture=KeelFixture(
+            path='imb_IRlowerThan9/yeast1.zip',
+            member='yeast1.dat',
+            n_rows=1484,
+            n_features=8,
+        ),
+    ),
+}
+
+
+def write_fixtures(root):
+    """Write the fixture files of all the downloaded datasets under ``root``.
+
+    Returns:
+        The expected outputs of the nodes of every dataset.
+    """
+    return {
+        name: writer(root, np.random.default_rng(0)) for name, writer in WRITERS.items()
+    }
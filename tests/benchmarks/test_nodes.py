@@ -0,0 +1,160 @@
+"""Tests and benchmarks of the downloading, transformation and processing nodes.
+
+The outputs of the nodes of every dataset are checked against the fixture files.
+With ``--benchmarks``, the measurements of every node are compared to the ones
+stored in ``baseline.json``, which is rewritten from the current measurements when
+the ``IAL_DATASETS_UPDATE_BASELINE`` environment variable is set.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.pipelines.data_downloading.pipeline import (
+    create_pipeline as create_downloading_pipeline,
+)
+from ial_datasets.pipelines.data_processing_numerical_features_binary_target_imbalanced.nodes import (
+    FACTOR_MAPPING,
+)
+from ial_datasets.pipelines.data_processing_numerical_features_binary_target_imbalanced.pipeline import (
+    create_pipeline as create_processing_pipeline,
+)
+from ial_datasets.pipelines.data_transformation_numerical_features_binary_target_balanced.pipeline import (
+    create_pipeline as create_balanced_pipeline,
+)
+from ial_datasets.pipelines.data_transformation_numerical_features_binary_target_imbalanced.pipeline import (
+    create_pipeline as create_imbalanced_pipeline,
+)
+from ial_datasets.profiling import profile
+from ial_datasets.registry import DATASETS, MIXED
+
+from .fixtures import WRITERS
+
+BASELINE_PATH = Path(__file__).parent / 'baseline.json'
+UPDATE_BASELINE = bool(os.environ.get('IAL_DATASETS_UPDATE_BASELINE'))
+# Maximum ratio to the baseline and absolute slack of every measurement.
+TOLERANCES = {
+    'wall_time': (1.5, 0.05),
+    'cpu_time': (1.5, 0.05),
+    'peak_memory': (1.25, 32 * 1024**2),
+    'bytes_read': (1.1, 1024**2),
+    'bytes_written': (1.1, 1024**2),
+}
+NODES = {
+    node.name: node
+    for pipeline in (
+        create_downloading_pipeline(),
+        create_balanced_pipeline(),
+        create_imbalanced_pipeline(),
+        create_processing_pipeline(),
+    )
+    for node in pipeline.nodes
+}
+STAGES = ['download', 'transform', 'process']
+
+
+def _node_names(name):
+    group = DATASETS[name].group
+    if group == MIXED:
+        return [f'download_{name}_data_node']
+    names = [f'download_{name}_data_node', f'transform_{name}_{group}_data_node']
+    if name in FACTOR_MAPPING:
+        names.append(f'{name}_node')
+    return names
+
+
+def _run_node(node, data, params):
+    inputs = {}
+    for name in node.inputs:
+        if name == 'parameters':
+            inputs[name] = params
+        elif name.startswith('params:'):
+            inputs[name] = params[name.removeprefix('params:')]
+        else:
+            inputs[name] = data
+    return node.run(inputs)
+
+
+@pytest.fixture(scope='session')
+def baseline():
+    try:
+        measurements = json.loads(BASELINE_PATH.read_text())
+    except FileNotFoundError:
+        measurements = {}
+    yield measurements
+    if UPDATE_BASELINE:
+        BASELINE_PATH.write_text(json.dumps(measurements, indent=2, sort_keys=True))
+
+
+def _check_processed(name, transformed, outputs, params):
+    """Check the imbalanced variants of a dataset and their folds."""
+    data = transformed.reset_index(drop=True)
+    n_positives = int(data['target'].sum())
+    group = DATASETS[name].group
+    for factor in FACTOR_MAPPING[name]:
+        variant = outputs[f'{name}_{group}_data_{factor}']
+        pd.testing.assert_frame_equal(variant, data.take(variant.index))
+        assert variant['target'].sum() == int(n_positives / factor)
+        assert (variant['target'] == 0).sum() == len(data) - n_positives
+        assert outputs[f'{name}_{group}_metadata_{factor}']['n_samples'] == len(variant)
+        folds = outputs[f'{name}_{group}_folds_{factor}']
+        assert folds.shape == (len(variant), params['cv']['n_repeats'])
+        assert set(np.unique(folds)) <= set(range(params['cv']['n_splits']))
+
+
+@pytest.mark.parametrize('name', list(WRITERS))
+def test_outputs(name, params, expected):
+    expected = expected[name]
+    node_names = _node_names(name)
+    downloaded = _run_node(NODES[node_names[0]], None, params)[f'{name}_data']
+    if DATASETS[name].chunked:
+        assert len(downloaded) > 1
+        downloaded = pd.concat([read() for read in downloaded.values()])
+        assert downloaded.shape == expected.shape
+        np.testing.assert_array_equal(downloaded['target'], expected.y)
+        if expected.X is not None:
+            features = downloaded.drop(columns='target').to_numpy()
+            np.testing.assert_array_equal(features, expected.X)
+        return
+    assert downloaded.shape == expected.shape
+    outputs = _run_node(NODES[node_names[1]], downloaded, params)
+    transformed, metadata = (outputs[name] for name in NODES[node_names[1]].outputs)
+    assert transformed.shape == (len(expected.y), expected.X.shape[1] + 1)
+    np.testing.assert_allclose(
+        transformed.drop(columns='target').to_numpy(), expected.X, rtol=1e-6
+    )
+    np.testing.assert_array_equal(transformed['target'], expected.y)
+    assert metadata['n_samples'] == len(expected.y)
+    if name in FACTOR_MAPPING:
+        outputs = _run_node(NODES[node_names[2]], transformed, params)
+        _check_processed(name, transformed, outputs, params)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    'node_name',
+    [node_name for name in WRITERS for node_name in _node_names(name)],
+)
+def test_node(node_name, params, baseline):
+    name = next(name for name in WRITERS if node_name in _node_names(name))
+    node_names = _node_names(name)
+    data = None
+    for previous_node_name in node_names[: node_names.index(node_name)]:
+        node = NODES[previous_node_name]
+        data = _run_node(node, data, params)[node.outputs[0]]
+    _, measurement = profile(_run_node, NODES[node_name], data, params)
+    measurement = measurement.to_dict()
+    if UPDATE_BASELINE:
+        baseline[node_name] = measurement
+        return
+    if node_name not in baseline:
+        pytest.skip(f'No baseline for {node_name}.')
+    regressions = {
+        key: (value, baseline[node_name][key])
+        for key, value in measurement.items()
+        if value > TOLERANCES[key][0] * baseline[node_name][key] + TOLERANCES[key][1]
+    }
+    assert not regressions, f'{node_name} regressed (current, baseline): {regressions}'
@@ -0,0 +1,73 @@
+"""Benchmarks of the startup of the project CLI."""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_PATH = Path(__file__).parents[2]
+HELP_BUDGET = 2.0
+PIPELINE_BUDGET = 3.0
+HEAVY_MODULES = ('pandas', 'pyarrow', 'sqlalchemy', 'sklearn', 'scipy')
+
+SINGLE_PIPELINE_SCRIPT = '''
+import sys
+from kedro.framework.project import pipelines
+from kedro.framework.startup import bootstrap_project
+
+bootstrap_project({project_path!r})
+pipelines[{pipeline_name!r}]
+print(' '.join(sorted(sys.modules)))
+'''
+
+
+def _run(args):
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *args],
+        cwd=PROJECT_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, result
+
+
+def _imported_modules(stderr):
+    return {
+        line.rsplit('|', 1)[-1].strip()
+        for line in stderr.splitlines()
+        if line.startswith('import time:')
+    }
+
+
+def test_help_startup():
+    duration = min(_run(['-m', 'ial_datasets', '--help'])[0] for _ in range(3))
+    _, result = _run(['-X', 'importtime', '-m', 'ial_datasets', '--help'])
+    assert not _imported_modules(result.stderr).intersection(HEAVY_MODULES)
+    assert duration < HELP_BUDGET
+
+
+@pytest.mark.parametrize(
+    'pipeline_name, unimported_module',
+    [
+        (
+            'data_processing_numerical_features_binary_target_imbalanced',
+            'ial_datasets.pipelines.data_downloading',
+        ),
+        (
+            'data_downloading',
+            'ial_datasets.pipelines.'
+            'data_processing_numerical_features_binary_target_imbalanced',
+        ),
+    ],
+)
+def test_single_pipeline_startup(pipeline_name, unimported_module):
+    script = SINGLE_PIPELINE_SCRIPT.format(
+        project_path=str(PROJECT_PATH), pipeline_name=pipeline_name
+    )
+    duration, result = _run(['-c', script])
+    assert unimported_module not in result.stdout.split()
+    assert duration < PIPELINE_BUDGET
@@ -0,0 +1,119 @@
+"""Micro-benchmark of the numeric transformation kernel.
+
+The output of the kernel is checked against the previous implementation, which
+copied the whole frame once for every step, on frames with missing values,
+non-contiguous features and categorical targets. With ``--benchmarks``, its time
+and memory are compared to those of the previous implementation on a frame with
+the shape of Arcene, and logged with ``pytest --log-cli-level=INFO``.
+"""
+
+import logging
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.utils import transform_numeric_features_binary_target
+
+N_ROWS = 200
+N_FEATURES = 10000
+REPEATS = 5
+
+logger = logging.getLogger(__name__)
+
+
+def _reference_transform(data, drop_cols=None, target_col=None, target_vals=None):
+    if drop_cols is None:
+        drop_cols = []
+    if target_col is None:
+        target_col = data.columns[-1]
+    if target_vals is None:
+        target_vals = [1]
+    y = data[target_col].rename('target').isin(target_vals).astype(int)
+    X = data.drop(columns=[target_col] + list(drop_cols)).astype(float)
+    columns_mapping = dict(zip(X.columns, range(X.shape[1])))
+    X = X.rename(columns=columns_mapping)
+    data = pd.concat([X, y], axis=1)
+    data = data.dropna()
+    return data
+
+
+def _measure(func, data):
+    """Return the result, the best time and the peak traced memory of a call."""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(data)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        result = func(data)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, min(times), peak_memory
+
+
+@pytest.fixture(scope='module')
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 1000, (N_ROWS, N_FEATURES))
+    y = rng.choice([-1, 1], N_ROWS)
+    return pd.DataFrame(np.column_stack([X, y]))
+
+
+def _mixed_data():
+    """Return a frame with missing values of several dtypes and string columns."""
+    rng = np.random.default_rng(1)
+    n_rows = 50
+    data = pd.DataFrame(
+        {
+            'id': [f'row{i}' for i in range(n_rows)],
+            'a': pd.array(rng.integers(0, 10, n_rows), dtype='Int64'),
+            'b': rng.random(n_rows),
+            'class': pd.Categorical(rng.choice(['x', 'y', 'z'], n_rows)),
+            'c': rng.integers(0, 100, n_rows),
+            'd': rng.random(n_rows).astype('float32'),
+        }
+    )
+    data.loc[[3, 17], 'a'] = pd.NA
+    data.loc[[5, 17, 30], 'b'] = np.nan
+    data.loc[[8], 'd'] = np.nan
+    return data
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'drop_cols': ['id'], 'target_col': 'class', 'target_vals': ['x']},
+        {'drop_cols': ['id', 'b'], 'target_col': 'class', 'target_vals': ['x', 'z']},
+        {'drop_cols': ['id', 'class', 'c'], 'target_col': 'd', 'target_vals': []},
+        {'drop_cols': ['id', 'class'], 'target_vals': [0.5]},
+    ],
+    ids=['categorical-target', 'non-contiguous', 'float-target', 'last-column'],
+)
+def test_transform_matches_reference(kwargs):
+    data = _mixed_data()
+    expected = _reference_transform(data, **kwargs)
+    result = transform_numeric_features_binary_target(data, **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(result) < len(data)
+
+
+@pytest.mark.benchmark
+def test_transform(data):
+    expected, reference_time, reference_memory = _measure(_reference_transform, data)
+    result, kernel_time, kernel_memory = _measure(
+        transform_numeric_features_binary_target, data
+    )
+    logger.info(
+        'Time: %.4fs -> %.4fs, peak memory: %.1fMB -> %.1fMB',
+        reference_time,
+        kernel_time,
+        reference_memory / 2**20,
+        kernel_memory / 2**20,
+    )
+    pd.testing.assert_frame_equal(result, expected)
+    assert kernel_memory < reference_memory
+    assert kernel_time < reference_time
@@ -0,0 +1,75 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from kedro.config import OmegaConfigLoader
+
+from .benchmarks.fixtures import URLS, write_fixtures
+
+PROJECT_PATH = Path(__file__).parents[1]
+# Small enough for the fixtures of the datasets ingested in blocks to span several.
+CHUNKED_MEMORY_BUDGET = 256 * 1024
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--benchmarks',
+        action='store_true',
+        help='Run the benchmarks, which compare measurements to their baselines.',
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmarks'):
+        return
+    skip = pytest.mark.skip(reason='Benchmarks only run with --benchmarks.')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='session')
+def fixtures_root(tmp_path_factory):
+    return tmp_path_factory.mktemp('fixtures')
+
+
+@pytest.fixture(scope='session')
+def expected(fixtures_root):
+    """Write the fixture files and return the expected outputs of their nodes."""
+    return write_fixtures(fixtures_root)
+
+
+@pytest.fixture(scope='session')
+def fixtures_url(fixtures_root, expected):
+    """Serve the fixture files from a local HTTP server."""
+    server = ThreadingHTTPServer(
+        ('127.0.0.1', 0), partial(_QuietHandler, directory=str(fixtures_root))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def params(fixtures_url, tmp_path):
+    """Return the project parameters with the sources pointing to the fixtures."""
+    params = OmegaConfigLoader(str(PROJECT_PATH / 'conf'), base_env='base')[
+        'parameters'
+    ]
+    params['uci_url'] = fixtures_url
+    params['http_cache'] = {**params['http_cache'], 'path': str(tmp_path / 'cache')}
+    params['chunked_ingest'] = {'memory_budget': CHUNKED_MEMORY_BUDGET}
+    urls_params = params['numerical_features_binary_target_imbalanced_data_urls']
+    urls_params['keel'] = f'{fixtures_url}keel/'
+    for name, url in URLS.items():
+        urls_params[name] = url
+    return params
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.datasets import CorpusDataset
+from ial_datasets.datasets.corpus_dataset import ALIGNMENT
+from kedro.io import DatasetError
+
+
+@pytest.fixture
+def frames():
+    rng = np.random.default_rng(0)
+    first = pd.DataFrame(rng.random((5, 3)).astype('float32'))
+    first['target'] = np.array([0, 1, 0, 1, 1], dtype='int8')
+    second = pd.DataFrame({'target': np.ones(3, 'int8'), 'a': np.arange(3.0)})
+    third = pd.DataFrame({'a': np.arange(4, dtype='int32')})
+    return {'first': first, 'second': second, 'third': third}
+
+
+def test_save_and_load(tmp_path, frames):
+    dataset = CorpusDataset(tmp_path / 'corpus.bin', label='target')
+    dataset.save(frames)
+    corpus = dataset.load()
+    assert list(corpus) == list(frames)
+    assert len(corpus) == len(frames)
+    for name, frame in frames.items():
+        pd.testing.assert_frame_equal(corpus[name], frame)
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_arrays(tmp_path, frames):
+    dataset = CorpusDataset(tmp_path / 'corpus.bin', label='target')
+    dataset.save(frames)
+    corpus = dataset.load()
+    X, y = corpus.arrays('first')
+    np.testing.assert_array_equal(X, frames['first'].drop(columns='target'))
+    np.testing.assert_array_equal(y, frames['first']['target'])
+    assert X.dtype == np.float32 and y.dtype == np.int8
+    assert X.ctypes.data % ALIGNMENT == 0 and y.ctypes.data % ALIGNMENT == 0
+    assert not X.flags.writeable
+    X, y = corpus.arrays('third')
+    assert y is None
+    with pytest.raises(KeyError):
+        corpus['missing']
+
+
+def test_save_replaces_file_of_loaded_corpus(tmp_path, frames):
+    dataset = CorpusDataset(tmp_path / 'corpus.bin', label='target')
+    dataset.save(frames)
+    corpus = dataset.load()
+    dataset.save({'third': frames['third']})
+    pd.testing.assert_frame_equal(corpus['first'], frames['first'])
+    assert list(dataset.load()) == ['third']
+
+
+def test_save_rejects_non_numerical_frames(tmp_path, frames):
+    dataset = CorpusDataset(tmp_path / 'corpus.bin')
+    dataset.save(frames)
+    with pytest.raises(DatasetError, match='Only numerical data frames'):
+        dataset.save({'text': pd.DataFrame({'a': ['x', 'y']})})
+    assert list(dataset.load()) == list(frames)
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'corpus.bin'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(DatasetError, match='is not a corpus file'):
+        CorpusDataset(path).load()
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.datasets import (
+    CorpusDataset,
+    MatrixDataset,
+    RowSubsetDataset,
+    TableDataset,
+)
+from kedro_viz.integrations.kedro.hooks import DatasetStatsHook
+
+
+def _data():
+    return pd.DataFrame({0: [1.0, 2.0], 'target': np.array([0, 1], 'int8')})
+
+
+def _datasets(tmp_path):
+    table = {'type': TableDataset, 'filepath': str(tmp_path / 'data.parquet')}
+    return {
+        'table': (TableDataset(table['filepath']), _data()),
+        'matrix': (MatrixDataset(tmp_path / 'matrix', label='target'), _data()),
+        'row_subset': (RowSubsetDataset(tmp_path / 'rows.npy', table), _data()),
+        'corpus': (
+            CorpusDataset(tmp_path / 'corpus.bin', label='target'),
+            {'data': _data()},
+        ),
+    }
+
+
+@pytest.mark.parametrize('name', ['table', 'matrix', 'row_subset', 'corpus'])
+def test_file_size_for_kedro_viz(tmp_path, name, caplog):
+    dataset, data = _datasets(tmp_path)[name]
+    assert not dataset.exists()
+    dataset.save(data)
+    assert dataset.exists()
+    assert DatasetStatsHook().get_file_size(dataset) is not None
+    assert 'Unable to get file size' not in caplog.text
+
+
+def test_row_subset_remote_filesystem(tmp_path):
+    base = {'type': TableDataset, 'filepath': str(tmp_path / 'data.parquet')}
+    TableDataset(base['filepath']).save(_data())
+    dataset = RowSubsetDataset('memory:///subsets/rows.npy', base)
+    dataset.save(_data().iloc[[1]])
+    pd.testing.assert_frame_equal(
+        dataset.load(), _data().iloc[[1]].reset_index(drop=True)
+    )
+    dataset._fs.rm(str(dataset._filepath))
+
+
+@pytest.mark.parametrize('dataset_type', [MatrixDataset, CorpusDataset])
+def test_memory_mapped_datasets_are_local(dataset_type):
+    with pytest.raises(ValueError, match='Only local'):
+        dataset_type('memory:///data')
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.datasets import MatrixDataset
+from kedro.config import OmegaConfigLoader
+from kedro.io import DataCatalog
+
+PROJECT_PATH = Path(__file__).parents[2]
+
+# Rewriting a memory-mapped file in place kills its readers with SIGBUS, so the
+# rewrite is checked in a subprocess.
+REWRITE_SCRIPT = '''
+import numpy as np
+import pandas as pd
+from ial_datasets.datasets import MatrixDataset
+
+dataset = MatrixDataset({filepath!r}, label='target')
+dataset.save(pd.DataFrame({{0: np.arange(100000.0), 'target': 1}}))
+data = dataset.load()
+dataset.save(pd.DataFrame({{0: [-1.0], 'target': [0]}}))
+assert data[0].sum() == np.arange(100000.0).sum()
+assert dataset.load()[0].tolist() == [-1.0]
+'''
+
+
+def _data():
+    return pd.DataFrame(
+        {0: [1.0, 2.0, 3.0], 1: [4.0, 5.0, 6.0], 'target': np.array([0, 1, 0], 'int8')}
+    )
+
+
+def test_save_and_load(tmp_path):
+    dataset = MatrixDataset(tmp_path / 'data', label='target', dtype='float32')
+    dataset.save(_data())
+    data = dataset.load()
+    pd.testing.assert_frame_equal(data, _data().astype({0: 'float32', 1: 'float32'}))
+    # The features are read-only views of the memory-mapped matrix.
+    assert not data[0].to_numpy().flags.writeable
+    assert not list(tmp_path.glob('data/*.tmp'))
+
+
+def test_save_replaces_files_of_loaded_data(tmp_path):
+    result = subprocess.run(
+        [sys.executable, '-c', REWRITE_SCRIPT.format(filepath=str(tmp_path / 'data'))],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize('env', [None, 'row_subsets'])
+def test_catalog_keeps_dtypes_of_node_outputs(env):
+    config_loader = OmegaConfigLoader(
+        str(PROJECT_PATH / 'conf'), base_env='base', default_run_env='local', env=env
+    )
+    catalog = DataCatalog.from_config(config_loader['catalog'])
+    for name in [
+        'arcene_data',
+        'madelon_data',
+        'arcene_numerical_features_binary_target_balanced_data',
+        'madelon_numerical_features_binary_target_imbalanced_data',
+        'madelon_numerical_features_binary_target_imbalanced_data_3',
+    ]:
+        dataset = catalog._get_dataset(name)
+        dataset = getattr(dataset, '_base', dataset)
+        assert dataset._dtype is None, name
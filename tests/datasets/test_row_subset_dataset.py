@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.datasets import MatrixDataset, RowSubsetDataset, TableDataset
+from kedro.config import OmegaConfigLoader
+from kedro.io import DataCatalog, DatasetError
+
+PROJECT_PATH = Path(__file__).parents[2]
+
+
+def _catalog(env):
+    config_loader = OmegaConfigLoader(
+        str(PROJECT_PATH / 'conf'), base_env='base', default_run_env='local', env=env
+    )
+    return DataCatalog.from_config(config_loader['catalog'])
+
+
+@pytest.mark.parametrize(
+    'name, base_type',
+    [('glass', TableDataset), ('madelon', MatrixDataset), ('libras', MatrixDataset)],
+)
+def test_row_subsets_env_resolves_variants_to_row_subsets(name, base_type):
+    dataset = _catalog('row_subsets')._get_dataset(
+        f'{name}_numerical_features_binary_target_imbalanced_data_3'
+    )
+    assert isinstance(dataset, RowSubsetDataset)
+    assert isinstance(dataset._base, base_type)
+
+
+@pytest.mark.parametrize(
+    'name, dataset_type',
+    [('glass', TableDataset), ('madelon', MatrixDataset), ('libras', MatrixDataset)],
+)
+def test_base_env_resolves_variants_to_full_copies(name, dataset_type):
+    dataset = _catalog(None)._get_dataset(
+        f'{name}_numerical_features_binary_target_imbalanced_data_3'
+    )
+    assert isinstance(dataset, dataset_type)
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame(
+        {0: np.arange(6, dtype='float32'), 1: np.ones(6, 'float32'), 'target': 0}
+    ).astype({'target': 'int8'})
+
+
+@pytest.mark.parametrize(
+    'base_type, base_name',
+    [
+        ('ial_datasets.datasets.TableDataset', 'base.parquet'),
+        ('ial_datasets.datasets.MatrixDataset', 'base'),
+    ],
+)
+def test_save_and_load(tmp_path, data, base_type, base_name):
+    base = {'type': base_type, 'filepath': str(tmp_path / base_name)}
+    if base_type.endswith('MatrixDataset'):
+        base['label'] = 'target'
+    dataset = RowSubsetDataset(tmp_path / 'subset.npy', base)
+    dataset._base.save(data)
+    subset = data.take([4, 1, 3])
+    dataset.save(subset)
+    positions = np.load(tmp_path / 'subset.npy')
+    assert positions.dtype == np.int32
+    np.testing.assert_array_equal(positions, [4, 1, 3])
+    pd.testing.assert_frame_equal(dataset.load(), subset.reset_index(drop=True))
+
+
+@pytest.mark.parametrize(
+    'index',
+    [pd.Index(['a', 'b', 'c']), pd.Index([0.0, 1.0, 2.0]), pd.Index([0, -1, 2])],
+    ids=['labels', 'floats', 'negative'],
+)
+def test_save_rejects_non_positional_index(tmp_path, data, index):
+    dataset = RowSubsetDataset(
+        tmp_path / 'subset.npy',
+        {'type': 'ial_datasets.datasets.TableDataset', 'filepath': str(tmp_path)},
+    )
+    with pytest.raises(DatasetError, match='integer row positions'):
+        dataset.save(data.iloc[:3].set_axis(index))
+    assert not (tmp_path / 'subset.npy').exists()
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.datasets import TableDataset
+
+
+def _data():
+    return pd.DataFrame(
+        {
+            0: np.array([1.5, np.nan, 3.0], 'float32'),
+            1: np.array([1, 2, 3], 'int32'),
+            2: [0.1, 0.2, 0.3],
+            3: ['a', None, 'c'],
+            4: [True, False, True],
+            'target': np.array([0, 1, 0], 'int8'),
+        }
+    )
+
+
+@pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+def test_save_and_load(tmp_path, file_format):
+    dataset = TableDataset(tmp_path / 'nested' / f'data.{file_format}', file_format)
+    assert not dataset.exists()
+    dataset.save(_data())
+    assert dataset.exists()
+    data = dataset.load()
+    pd.testing.assert_frame_equal(data, _data())
+    assert data.columns.tolist() == [0, 1, 2, 3, 4, 'target']
+
+
+@pytest.mark.parametrize('compression', ['zstd', 'lz4', 'uncompressed'])
+def test_compression(tmp_path, compression):
+    dataset = TableDataset(tmp_path / 'data.feather', 'feather', compression)
+    dataset.save(_data())
+    pd.testing.assert_frame_equal(dataset.load(), _data())
+
+
+def test_remote_filesystem():
+    dataset = TableDataset('memory://tables/data.parquet')
+    dataset.save(_data())
+    assert dataset.exists()
+    pd.testing.assert_frame_equal(dataset.load(), _data())
+    assert dataset._protocol == 'memory'
+    assert dataset._fs.size(str(dataset._filepath)) > 0
+    dataset._fs.rm(str(dataset._filepath))
+
+
+def test_unknown_file_format(tmp_path):
+    with pytest.raises(ValueError, match='Unknown file format'):
+        TableDataset(tmp_path / 'data.csv', 'csv')
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.pipelines.data_downloading import nodes
+from ial_datasets.pipelines.data_downloading.nodes import _assemble, ingest
+from ial_datasets.registry import DATASETS
+
+INT32_OVERFLOW = 2**31
+LATE_ROW = 350
+
+
+def _parts():
+    rng = np.random.default_rng(0)
+    parts = []
+    for n_rows in [5, 0, 3, 0, 4]:
+        parts.append(
+            pd.DataFrame(
+                {
+                    0: rng.integers(0, 10, n_rows),
+                    1: rng.random(n_rows),
+                    2: rng.choice(['a', 'b'], n_rows),
+                    3: rng.integers(0, 10, n_rows).astype('int32'),
+                    4: rng.random(n_rows).astype('float32'),
+                }
+            )
+        )
+    parts[2][0] = parts[2][0].astype('float64')
+    parts[4][3] = parts[4][3].astype('int64')
+    parts[3][1] = parts[3][1].astype(object)
+    return parts
+
+
+def test_assemble_matches_concat():
+    parts = _parts()
+    expected = pd.concat(parts, ignore_index=True)
+    result = _assemble(parts)
+    pd.testing.assert_frame_equal(result, expected)
+    assert not parts
+
+
+@pytest.mark.parametrize('sizes', [[0, 0], [0, 2], [2, 0]])
+def test_assemble_empty_parts(sizes):
+    parts = [
+        pd.DataFrame({'a': np.arange(n_rows), 'b': np.full(n_rows, 'x')})
+        for n_rows in sizes
+    ]
+    expected = pd.concat(parts, ignore_index=True)
+    pd.testing.assert_frame_equal(_assemble(parts), expected)
+
+
+def test_assemble_rejects_different_columns():
+    parts = [pd.DataFrame({0: [1]}), pd.DataFrame({1: [1]})]
+    with pytest.raises(ValueError, match='different columns'):
+        _assemble(parts)
+
+
+def test_ingest_applies_one_schema_to_all_blocks(tmp_path, monkeypatch):
+    n_rows = 400
+    rows = [f'{i},{i},x{i % 3},{i % 7},{1 + i % 2}' for i in range(n_rows)]
+    # Only a late block overflows 32 bits and holds missing values.
+    rows[LATE_ROW] = f'{INT32_OVERFLOW},,x0,1,2'
+    path = tmp_path / 'covtype.data'
+    path.write_text('\n'.join(rows) + '\n')
+    monkeypatch.setattr(nodes, 'fetch_all', lambda urls, params, sha256s: [path])
+    params = {
+        'uci_url': 'http://host/',
+        'mixed_features_binary_target_data_urls': {'covertype': 'covtype.data'},
+        'chunked_ingest': {'memory_budget': 4096},
+        'dtypes': {'features': 'float32', 'target': 'int8'},
+    }
+    blocks = [read() for read in ingest(params, DATASETS['covertype']).values()]
+    assert len(blocks[0]) < LATE_ROW
+    assert all(block.dtypes.equals(blocks[0].dtypes) for block in blocks)
+    assert blocks[0].dtypes.tolist() == [
+        np.dtype('int64'),
+        np.dtype('float32'),
+        np.dtype(object),
+        np.dtype('int32'),
+        np.dtype('int8'),
+    ]
+    data = pd.concat(blocks, ignore_index=True)
+    assert len(data) == n_rows
+    assert data[0][LATE_ROW] == INT32_OVERFLOW
+    assert np.isnan(data[1][LATE_ROW])
+    assert data['target'].sum() == n_rows // 2 + 1
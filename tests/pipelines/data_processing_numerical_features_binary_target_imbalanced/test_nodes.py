@@ -0,0 +1,79 @@
+import zlib
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.pipelines.data_processing_numerical_features_binary_target_imbalanced.nodes import (
+    FACTOR_MAPPING,
+    make_data_imbalanced,
+    make_fold_labels,
+)
+from ial_datasets.registry import IMBALANCED, SPECS
+
+PARAMS = {'random_state': 17, 'cv': {'n_splits': 5, 'n_repeats': 3}}
+
+
+@pytest.fixture
+def y():
+    return np.random.default_rng(0).permutation(np.repeat([0, 1], [83, 17]))
+
+
+def test_fold_labels_are_deterministic(y):
+    folds = make_fold_labels(y, 5, 3, np.random.SeedSequence(17, spawn_key=(1,)))
+    pd.testing.assert_frame_equal(
+        folds, make_fold_labels(y, 5, 3, np.random.SeedSequence(17, spawn_key=(1,)))
+    )
+    other = make_fold_labels(y, 5, 3, np.random.SeedSequence(17, spawn_key=(2,)))
+    assert not folds.equals(other)
+    assert folds.dtypes.eq(np.int32).all()
+    assert list(folds.columns) == [0, 1, 2]
+    assert not folds[0].equals(folds[1])
+
+
+def test_fold_labels_keep_class_ratio(y):
+    folds = make_fold_labels(y, 5, 3, np.random.SeedSequence(17))
+    for repeat in folds:
+        counts = pd.crosstab(folds[repeat], y)
+        assert list(counts.index) == list(range(5))
+        assert (counts.max() - counts.min()).max() <= 1
+        sizes = counts.sum(axis=1)
+        assert sizes.max() - sizes.min() <= 1
+
+
+def _data(y):
+    return pd.DataFrame({0: np.arange(y.size, dtype='float32'), 'target': y})
+
+
+def test_folds_are_seeded_by_dataset_name(y):
+    outputs = make_data_imbalanced(_data(y), PARAMS, 'glass', [1, 2])
+    variants, folds = outputs[:2], outputs[4:]
+    spawn_key = (zlib.crc32(b'glass'),)
+    for variant, factor, variant_folds in zip(variants, [1, 2], folds):
+        seed = np.random.SeedSequence(17, spawn_key=(*spawn_key, factor))
+        pd.testing.assert_frame_equal(
+            variant_folds, make_fold_labels(variant['target'].to_numpy(), 5, 3, seed)
+        )
+    other_folds = make_data_imbalanced(_data(y), PARAMS, 'wine', [1, 2])[4:]
+    assert not folds[0].equals(other_folds[0])
+    again = make_data_imbalanced(_data(y), PARAMS, 'glass', [1, 2])
+    for first, second in zip(outputs, again):
+        if isinstance(first, pd.DataFrame):
+            pd.testing.assert_frame_equal(first, second)
+        else:
+            assert first == second
+
+
+def test_variants_keep_row_order(y):
+    data = _data(y)
+    variants = make_data_imbalanced(data, PARAMS, 'glass', [1, 3])[:2]
+    assert len(variants[0]) == len(data)
+    for variant in variants:
+        assert variant.index.is_monotonic_increasing
+        pd.testing.assert_frame_equal(variant, data.loc[variant.index])
+    assert variants[1]['target'].sum() == y.sum() // 3
+
+
+def test_factors_are_set_for_every_imbalanced_spec():
+    imbalanced = [spec.name for spec in SPECS if spec.group == IMBALANCED]
+    assert list(FACTOR_MAPPING) == imbalanced
+    assert all(FACTOR_MAPPING.values())
@@ -0,0 +1 @@
+"""Project package of the runner tests, configured in the processes they spawn."""
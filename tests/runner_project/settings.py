@@ -0,0 +1,3 @@
+"""Settings of the project of the runner tests, which registers no hooks."""
+
+HOOKS = ()
@@ -0,0 +1,249 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from ial_datasets import fetch as fetch_module
+from ial_datasets.fetch import BlobCache, fetch, fetch_all
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve the files of the server with validators, ranges and failures."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        time.sleep(server.delay)
+        if server.status is not None:
+            self._send(server.status)
+            return
+        body = server.files.get(self.path)
+        if body is None:
+            self._send(404)
+            return
+        validators = []
+        if server.etag:
+            validators.append(('ETag', server.etag))
+        if server.last_modified:
+            validators.append(('Last-Modified', server.last_modified))
+        current = {server.etag, server.last_modified} - {None}
+        if (
+            self.headers.get('If-None-Match') in current
+            or self.headers.get('If-Modified-Since') in current
+        ):
+            self._send(304, headers=validators)
+            return
+        if self.headers.get('Range') and self.headers.get('If-Range') in current:
+            offset = int(self.headers['Range'].removeprefix('bytes=').rstrip('-'))
+            if server.range_start is not None:
+                offset = server.range_start
+            content_range = f'bytes {offset}-{len(body) - 1}/{len(body)}'
+            self._send(
+                206, body[offset:], [*validators, ('Content-Range', content_range)]
+            )
+            return
+        if server.truncate:
+            server.truncate -= 1
+            self.send_response(200)
+            for name, value in validators:
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        self._send(200, body, validators)
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.files = {'/data.csv': b'a,b\n' + b'1,2\n' * 2047}
+    server.requests = []
+    server.etag = ETAG
+    server.last_modified = LAST_MODIFIED
+    server.status = None
+    server.truncate = 0
+    server.delay = 0
+    server.range_start = None
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f'http://127.0.0.1:{server.server_port}/'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def params(tmp_path):
+    return {
+        'http_cache': {
+            'path': str(tmp_path / 'cache'),
+            'max_size': 1024**2,
+            'max_age': 0,
+            'timeout': 5,
+            'max_retries': 2,
+        }
+    }
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Stream the downloads in chunks that divide the truncated responses."""
+    monkeypatch.setattr(fetch_module, 'CHUNK_SIZE', 256)
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def test_checksum_pinning(server, params):
+    url = f'{server.url}data.csv'
+    body = server.files['/data.csv']
+    assert fetch(url, params, _sha256(body)).read_bytes() == body
+    assert fetch(url, params, _sha256(body)).read_bytes() == body
+    assert len(server.requests) == 1
+    with pytest.raises(ValueError, match='Checksum mismatch'):
+        fetch(url, params, _sha256(b'other'))
+    assert 'If-None-Match' not in server.requests[-1]
+    assert fetch(url, params, _sha256(body)).read_bytes() == body
+
+
+@pytest.mark.parametrize(
+    'etag, last_modified, header',
+    [(ETAG, None, 'If-None-Match'), (None, LAST_MODIFIED, 'If-Modified-Since')],
+    ids=['etag', 'last-modified'],
+)
+def test_revalidation(server, params, etag, last_modified, header):
+    server.etag, server.last_modified = etag, last_modified
+    url = f'{server.url}data.csv'
+    path = fetch(url, params)
+    assert fetch(url, params) == path
+    assert header not in server.requests[0]
+    assert server.requests[1][header] in (etag, last_modified)
+    server.files['/data.csv'] = b'a,b\n3,4\n'
+    server.etag = etag and '"v2"'
+    server.last_modified = last_modified and 'Tue, 02 Jan 2024 00:00:00 GMT'
+    assert fetch(url, params).read_bytes() == b'a,b\n3,4\n'
+
+
+def test_fresh_copy_is_not_revalidated(server, params):
+    params['http_cache']['max_age'] = 3600
+    url = f'{server.url}data.csv'
+    assert fetch(url, params) == fetch(url, params)
+    assert len(server.requests) == 1
+
+
+def test_resume_interrupted_download(server, params, small_chunks):
+    server.truncate = 1
+    url = f'{server.url}data.csv'
+    assert fetch(url, params).read_bytes() == server.files['/data.csv']
+    assert 'Range' not in server.requests[0]
+    assert (
+        server.requests[1]['Range'] == f'bytes={len(server.files["/data.csv"]) // 2}-'
+    )
+    assert server.requests[1]['If-Range'] == ETAG
+    assert not list((Path(params['http_cache']['path']) / 'partial').iterdir())
+
+
+@pytest.mark.parametrize('range_start', [0, 100], ids=['from-start', 'other'])
+def test_restart_wrong_range(server, params, small_chunks, caplog, range_start):
+    server.truncate = 1
+    server.range_start = range_start
+    url = f'{server.url}data.csv'
+    assert fetch(url, params).read_bytes() == server.files['/data.csv']
+    assert 'Range' in server.requests[1]
+    assert 'instead of' in caplog.text
+
+
+def test_resume_in_next_run(server, params, small_chunks):
+    params['http_cache']['max_retries'] = 0
+    server.truncate = 1
+    url = f'{server.url}data.csv'
+    with pytest.raises(Exception, match='Connection broken'):
+        fetch(url, params)
+    assert fetch(url, params).read_bytes() == server.files['/data.csv']
+    assert server.requests[1]['If-Range'] == ETAG
+
+
+def test_restart_changed_download(server, params, small_chunks):
+    params['http_cache']['max_retries'] = 0
+    server.truncate = 1
+    url = f'{server.url}data.csv'
+    with pytest.raises(Exception, match='Connection broken'):
+        fetch(url, params)
+    server.files['/data.csv'] = b'a,b\n' + b'5,6\n' * 2047
+    server.etag = '"v2"'
+    assert fetch(url, params).read_bytes() == server.files['/data.csv']
+
+
+def test_stale_copy_when_server_fails(server, params, caplog):
+    url = f'{server.url}data.csv'
+    path = fetch(url, params)
+    server.status = 500
+    assert fetch(url, params) == path
+    assert 'Using the cached copy' in caplog.text
+
+
+def test_failure_without_cached_copy(server, params):
+    server.status = 500
+    with pytest.raises(Exception, match='500'):
+        fetch(f'{server.url}data.csv', params)
+
+
+def test_concurrent_fetches_download_once(server, params):
+    params['http_cache']['max_age'] = 3600
+    server.delay = 0.2
+    url = f'{server.url}data.csv'
+    paths = fetch_all([url] * 4, params)
+    assert len(set(paths)) == 1
+    assert len(server.requests) == 1
+
+
+def _store(cache, tmp_path, url, data):
+    tmp_file = tmp_path / 'download'
+    tmp_file.write_bytes(data)
+    return cache.store(url, tmp_file, _sha256(data), {})
+
+
+def test_eviction_counts_shared_blobs_once(tmp_path):
+    cache = BlobCache(tmp_path / 'cache', max_size=200)
+    shared = _store(cache, tmp_path, 'http://host/a', b'x' * 100)
+    _store(cache, tmp_path, 'http://host/b', b'x' * 100)
+    _store(cache, tmp_path, 'http://host/c', b'y' * 100)
+    assert all(cache.lookup(f'http://host/{name}') for name in 'abc')
+    _store(cache, tmp_path, 'http://host/d', b'z' * 100)
+    assert cache.lookup('http://host/a') is None
+    assert cache.lookup('http://host/b') is None
+    assert not shared.exists()
+    assert cache.lookup('http://host/c') and cache.lookup('http://host/d')
+
+
+def test_eviction_keeps_blobs_of_other_urls(tmp_path):
+    cache = BlobCache(tmp_path / 'cache', max_size=200)
+    shared = _store(cache, tmp_path, 'http://host/a', b'x' * 100)
+    _store(cache, tmp_path, 'http://host/b', b'y' * 100)
+    _store(cache, tmp_path, 'http://host/c', b'x' * 100)
+    _store(cache, tmp_path, 'http://host/d', b'z' * 100)
+    assert cache.lookup('http://host/a') is None
+    assert cache.lookup('http://host/b') is None
+    assert shared.exists()
+    assert cache.lookup('http://host/c') and cache.lookup('http://host/d')
@@ -0,0 +1,107 @@
+import sqlite3
+
+import pytest
+from ial_datasets.hooks import DownloadHooks, InstrumentationHooks
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import node, pipeline
+
+
+def _identity(x):
+    return x
+
+
+@pytest.fixture
+def hooks(tmp_path):
+    return InstrumentationHooks(
+        tmp_path / 'session_store.db', tmp_path / 'metrics.prom'
+    )
+
+
+def _peak_memories(hooks):
+    with sqlite3.connect(hooks._db_path) as connection:
+        return dict(
+            connection.execute(
+                "SELECT node, peak_memory FROM metrics WHERE operation = 'compute'"
+            ).fetchall()
+        )
+
+
+def test_peak_memory_of_nodes_run_alone(hooks):
+    for name in ('first', 'second'):
+        node_ = node(_identity, 'a', 'b', name=name)
+        hooks.before_node_run(node=node_, session_id='session')
+        hooks.after_node_run(node=node_, session_id='session')
+    peak_memories = _peak_memories(hooks)
+    assert peak_memories['first'] > 0
+    assert peak_memories['second'] > 0
+
+
+def test_peak_memory_of_overlapping_nodes_is_missing(hooks):
+    first = node(_identity, 'a', 'b', name='first')
+    second = node(_identity, 'c', 'd', name='second')
+    hooks.before_node_run(node=first, session_id='session')
+    hooks.before_node_run(node=second, session_id='session')
+    hooks.after_node_run(node=second, session_id='session')
+    hooks.after_node_run(node=first, session_id='session')
+    third = node(_identity, 'e', 'f', name='third')
+    hooks.before_node_run(node=third, session_id='session')
+    hooks.after_node_run(node=third, session_id='session')
+    peak_memories = _peak_memories(hooks)
+    assert peak_memories['first'] is None
+    assert peak_memories['second'] is None
+    assert peak_memories['third'] > 0
+    hooks.after_pipeline_run(run_params={'session_id': 'session'})
+    metrics = hooks._metrics_path.read_text()
+    assert 'ial_datasets_node_peak_memory_bytes{node="third"}' in metrics
+    assert 'node="first"} None' not in metrics
+
+
+@pytest.fixture
+def prefetched(monkeypatch):
+    from ial_datasets.pipelines.data_downloading import nodes
+
+    prefetched = []
+    monkeypatch.setattr(
+        nodes, 'prefetch', lambda params, names: prefetched.append(names)
+    )
+    return prefetched
+
+
+def _download_pipeline():
+    return pipeline(
+        [
+            node(_identity, 'params:a', 'ecoli_data', name='a', tags='download'),
+            node(_identity, 'params:b', 'glass_data', name='b', tags='download'),
+            node(_identity, 'ecoli_data', 'c', name='c'),
+        ]
+    )
+
+
+def test_prefetch_when_first_download_node_runs(prefetched):
+    hooks = DownloadHooks()
+    catalog = DataCatalog({'parameters': MemoryDataset({})})
+    download_pipeline = _download_pipeline()
+    hooks.before_pipeline_run(download_pipeline, catalog)
+    for node_ in download_pipeline.nodes:
+        hooks.before_node_run(node_)
+    assert prefetched == [['ecoli', 'glass']]
+
+
+def test_no_prefetch_when_download_nodes_are_skipped(prefetched):
+    hooks = DownloadHooks()
+    catalog = DataCatalog({'parameters': MemoryDataset({})})
+    download_pipeline = _download_pipeline()
+    hooks.before_pipeline_run(download_pipeline, catalog)
+    hooks.before_node_run(download_pipeline.nodes[-1])
+    assert prefetched == []
+
+
+def test_no_prefetch_of_skipped_download_nodes(prefetched):
+    hooks = DownloadHooks()
+    catalog = DataCatalog({'parameters': MemoryDataset({})})
+    download_pipeline = _download_pipeline()
+    hooks.before_pipeline_run(download_pipeline, catalog)
+    ecoli, glass = download_pipeline.nodes[:2]
+    hooks.skip({ecoli})
+    hooks.before_node_run(glass)
+    assert prefetched == [['glass']]
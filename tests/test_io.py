@@ -0,0 +1,30 @@
+import hashlib
+import json
+
+import pytest
+from ial_datasets import _io
+
+
+def test_hash_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(_io, 'CHUNK_SIZE', 3)
+    path = tmp_path / 'file.bin'
+    path.write_bytes(b'0123456789')
+    assert _io.hash_file(path) == hashlib.sha256(b'0123456789').hexdigest()
+
+
+def test_atomic_writes_replace_file(tmp_path):
+    path = tmp_path / 'index.json'
+    path.write_text('{}')
+    _io.write_json(path, {'b': 1, 'a': 2})
+    assert json.loads(path.read_text()) == {'a': 2, 'b': 1}
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_failed_atomic_write_keeps_file(tmp_path):
+    path = tmp_path / 'data.bin'
+    path.write_bytes(b'old')
+    with pytest.raises(RuntimeError), _io.atomic_open(path) as file:
+        file.write(b'new')
+        raise RuntimeError
+    assert path.read_bytes() == b'old'
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,96 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets import loader
+from ial_datasets.datasets import TableDataset
+from kedro.io import DataCatalog
+
+DATASET_NAME = 'ecoli_numerical_features_binary_target_imbalanced_data'
+
+
+def _arrays(n_bytes):
+    return np.zeros(n_bytes, dtype=np.uint8), np.zeros(0, dtype=np.uint8)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = loader._ArrayCache(300)
+    for name in 'abc':
+        cache.put((None, name, 0), _arrays(100))
+    assert cache.get((None, 'a', 0)) is not None
+    cache.put((None, 'd', 0), _arrays(100))
+    assert cache.get((None, 'b', 0)) is None
+    assert all(cache.get((None, name, 0)) is not None for name in 'acd')
+
+
+def test_cache_skips_arrays_over_budget():
+    cache = loader._ArrayCache(100)
+    cache.put((None, 'a', 0), _arrays(101))
+    assert cache.get((None, 'a', 0)) is None
+
+
+def test_cache_replaces_older_versions():
+    cache = loader._ArrayCache(300)
+    cache.put((None, 'a', 0), _arrays(100))
+    cache.put(('local', 'a', 0), _arrays(100))
+    cache.put((None, 'a', 1), _arrays(100))
+    assert cache.get((None, 'a', 0)) is None
+    assert cache.get(('local', 'a', 0)) is not None
+    cache.put((None, 'b', 0), _arrays(100))
+    assert cache.get((None, 'a', 1)) is not None
+
+
+@pytest.fixture
+def dataset_path(tmp_path, monkeypatch):
+    """Point the catalog of the tests env to a transformed dataset in a file."""
+    path = tmp_path / 'ecoli_data.parquet'
+    dataset = TableDataset(path)
+    dataset.save(pd.DataFrame({0: [0.1, 0.2], 1: [1.0, 2.0], 'target': [0, 1]}))
+    monkeypatch.setitem(loader._catalogs, 'tests', DataCatalog({DATASET_NAME: dataset}))
+    loader.clear_cache()
+    yield path
+    loader.clear_cache()
+
+
+def test_load_returns_read_only_views(dataset_path):
+    X, y = loader.load('ecoli', env='tests')
+    np.testing.assert_array_equal(X, [[0.1, 1.0], [0.2, 2.0]])
+    np.testing.assert_array_equal(y, [0, 1])
+    assert not X.flags.writeable and not y.flags.writeable
+    with pytest.raises(ValueError, match='read-only'):
+        X[0, 0] = 1
+    X_again, _ = loader.load('ecoli', env='tests')
+    assert X_again is not X and np.shares_memory(X_again, X)
+
+
+def test_load_invalidates_changed_files(dataset_path):
+    X, _ = loader.load('ecoli', env='tests')
+    TableDataset(dataset_path).save(pd.DataFrame({0: [0.5], 1: [5.0], 'target': [1]}))
+    stat = dataset_path.stat()
+    os.utime(dataset_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    X_changed, _ = loader.load('ecoli', env='tests')
+    np.testing.assert_array_equal(X_changed, [[0.5, 5.0]])
+    assert len(loader._cache._entries) == 1
+
+
+@pytest.mark.parametrize(
+    'name, factor, layer, message',
+    [
+        ('unknown', None, None, 'Unknown dataset'),
+        ('ecoli', None, 'downloaded', 'Unknown layer'),
+        ('ecoli', None, 'processed', 'Processed data is only available'),
+        ('arcene', 1, None, 'Processed data is only available'),
+    ],
+)
+def test_dataset_name_errors(name, factor, layer, message):
+    with pytest.raises(ValueError, match=message):
+        loader._dataset_name(name, factor, layer)
+
+
+def test_dataset_name():
+    assert loader._dataset_name('ecoli', None, None) == DATASET_NAME
+    assert loader._dataset_name('ecoli', 3, None) == f'{DATASET_NAME}_3'
+    assert loader._dataset_name('arcene', None, None) == (
+        'arcene_numerical_features_binary_target_balanced_data'
+    )
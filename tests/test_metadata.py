@@ -0,0 +1,71 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from ial_datasets.metadata import describe, query, read_index
+from ial_datasets.registry import DATASETS
+
+
+def _data(n_positives):
+    return pd.DataFrame(
+        {
+            0: np.arange(10, dtype='float32'),
+            'target': np.repeat(
+                np.array([0, 1], 'int8'), [10 - n_positives, n_positives]
+            ),
+        }
+    )
+
+
+@pytest.fixture
+def root(tmp_path):
+    """Write the metadata of the transformed and processed glass and wine datasets."""
+    entries = [
+        describe(_data(5), DATASETS['glass']),
+        describe(_data(2), DATASETS['glass'], factor=2),
+        describe(_data(1), DATASETS['wine'], factor=5),
+    ]
+    for entry in entries:
+        (tmp_path / f'{entry["name"]}.json').write_text(json.dumps(entry))
+    return tmp_path
+
+
+def test_describe():
+    entry = describe(_data(2), DATASETS['glass'], factor=2)
+    assert entry['name'] == 'glass_numerical_features_binary_target_imbalanced_data_2'
+    assert entry['homepage'] == DATASETS['glass'].url
+    assert entry['class_counts'] == {'0': 8, '1': 2}
+    assert entry['imbalance_ratio'] == pytest.approx(4.0)
+    assert (entry['n_samples'], entry['n_features']) == (10, 1)
+    assert entry['n_bytes'] == 10 * 4 + 10
+    assert entry['sha256'] == describe(_data(2), DATASETS['glass'])['sha256']
+    assert entry['sha256'] != describe(_data(3), DATASETS['glass'])['sha256']
+
+
+def test_read_index_round_trip(root):
+    index = read_index(root)
+    assert list(index) == sorted(index)
+    assert index['glass_numerical_features_binary_target_imbalanced_data_2'] == (
+        describe(_data(2), DATASETS['glass'], factor=2)
+    )
+
+
+def test_read_index_without_files(tmp_path):
+    assert read_index(tmp_path / 'missing') == {}
+    assert query(tmp_path / 'missing', factor=None) == []
+
+
+def test_query(root):
+    assert [entry['name'] for entry in query(root, dataset='glass')] == [
+        'glass_numerical_features_binary_target_imbalanced_data',
+        'glass_numerical_features_binary_target_imbalanced_data_2',
+    ]
+    assert [entry['factor'] for entry in query(root, factor=None)] == [None]
+    selected = query(root, imbalance_ratio=lambda ratio: ratio > 1, dataset='glass')
+    assert [entry['factor'] for entry in selected] == [2]
+    # Predicates are not satisfied by missing values.
+    selected = query(root, factor=lambda factor: True)
+    assert [entry['factor'] for entry in selected] == [2, 5]
+    assert query(root, unknown=lambda value: True) == []
+    assert query(root) == list(read_index(root).values())
@@ -0,0 +1,203 @@
+import inspect
+import os
+import pickle
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+from ial_datasets import runners
+from ial_datasets.hooks import DownloadHooks
+from ial_datasets.pipelines.data_downloading import nodes
+from ial_datasets.runners import (
+    IO_BOUND_TAG,
+    HybridRunner,
+    IncrementalRunner,
+    _module_sources,
+    _stable_repr,
+)
+from kedro.config import OmegaConfigLoader
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.framework.project import pipelines
+from kedro.framework.startup import bootstrap_project
+from kedro.io import DataCatalog
+from kedro.pipeline import node, pipeline
+from kedro_datasets.pickle import PickleDataset
+
+PROJECT_PATH = Path(__file__).parents[1]
+
+
+def test_fingerprint_includes_imported_project_modules():
+    names = [name for name, _ in _module_sources(nodes.__name__)]
+    assert names == sorted(names)
+    assert {nodes.__name__, 'ial_datasets.fetch', 'ial_datasets.registry'} <= set(names)
+    assert not any(name.startswith('kedro') for name in names)
+
+
+def test_fingerprint_of_function_changes_with_imported_module(monkeypatch):
+    def source(module):
+        if module.__name__ == 'ial_datasets.fetch':
+            return '# changed'
+        return original(module)
+
+    original = inspect.getsource
+    before = _stable_repr(nodes.download)
+    _module_sources.cache_clear()
+    monkeypatch.setattr(inspect, 'getsource', source)
+    try:
+        assert _stable_repr(nodes.download) != before
+    finally:
+        _module_sources.cache_clear()
+
+
+def _download(value):
+    return {
+        'value': value,
+        'pid': os.getpid(),
+        'thread': threading.current_thread().name,
+    }
+
+
+def _process(downloaded, seed):
+    rng = np.random.default_rng(seed)
+    return {'value': downloaded['value'] + rng.random(), 'pid': os.getpid()}
+
+
+def _combine(first, second):
+    return {'value': [first['value'], second['value']], 'pid': os.getpid()}
+
+
+def _hybrid_pipeline():
+    return pipeline(
+        [
+            node(_download, 'params:a', 'a_data', name='a', tags='download'),
+            node(_download, 'params:b', 'b_data', name='b', tags='download'),
+            node(_process, ['a_data', 'params:seed'], 'a_processed', name='c'),
+            node(_process, ['b_data', 'params:seed'], 'b_processed', name='d'),
+            node(_combine, ['a_processed', 'b_processed'], 'combined', name='e'),
+        ]
+    )
+
+
+def _run_hybrid():
+    catalog = DataCatalog(
+        feed_dict={'params:a': 1, 'params:b': 2, 'params:seed': 0},
+        datasets={
+            name: PickleDataset(filepath=f'{name}.pkl')
+            for name in ('a_data', 'b_data', 'a_processed', 'b_processed')
+        },
+    )
+    outputs = HybridRunner(max_workers=2, max_threads=2).run(
+        _hybrid_pipeline(), catalog
+    )
+    return catalog, outputs['combined']
+
+
+@pytest.fixture
+def runner_project(tmp_path, monkeypatch):
+    """Run in a temporary directory with a project that registers no hooks."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(runners, 'PACKAGE_NAME', 'tests.runner_project')
+
+
+def test_hybrid_runner_splits_nodes(runner_project):
+    catalog, combined = _run_hybrid()
+    downloaded = [catalog.load(name) for name in ('a_data', 'b_data')]
+    processed = [catalog.load(name) for name in ('a_processed', 'b_processed')]
+    assert {output['pid'] for output in downloaded} == {os.getpid()}
+    assert all(output['thread'] != 'MainThread' for output in downloaded)
+    assert os.getpid() not in {output['pid'] for output in [*processed, combined]}
+    assert combined['value'] == [output['value'] for output in processed]
+
+
+def test_hybrid_runner_is_deterministic(runner_project):
+    _, combined = _run_hybrid()
+    _, combined_again = _run_hybrid()
+    assert combined['value'] == combined_again['value']
+    rng = np.random.default_rng(0)
+    expected = 1 + rng.random()
+    assert combined['value'][0] == expected
+
+
+def test_project_nodes_are_picklable():
+    bootstrap_project(PROJECT_PATH)
+    for node_ in pipelines['__default__'].nodes:
+        if IO_BOUND_TAG not in node_.tags:
+            assert pickle.loads(pickle.dumps(node_)).name == node_.name
+
+
+def _feed_dict(params):
+    """Return the parameters and their nested entries, as added by the context."""
+    feed_dict = {'parameters': params}
+
+    def add(key, value):
+        feed_dict[f'params:{key}'] = value
+        if isinstance(value, dict):
+            for name, nested in value.items():
+                add(f'{key}.{name}', nested)
+
+    for key, value in params.items():
+        add(key, value)
+    return feed_dict
+
+
+def _project_catalog(params):
+    config = OmegaConfigLoader(
+        str(PROJECT_PATH / 'conf'), base_env='base', default_run_env='local'
+    )
+    catalog = DataCatalog.from_config(config['catalog'])
+    catalog.add_feed_dict(_feed_dict(params))
+    return catalog
+
+
+def test_hybrid_runner_runs_default_pipeline(runner_project, params):
+    bootstrap_project(PROJECT_PATH)
+    catalog = _project_catalog(params)
+    default = pipelines['__default__']
+    HybridRunner(max_workers=2).run(default, catalog)
+    assert all(catalog.exists(name) for name in default.all_outputs())
+    assert catalog.load('census_data')
+
+
+def _run_incremental(download_pipeline, params, prefetched):
+    catalog = _project_catalog(params)
+    hook_manager = _create_hook_manager()
+    hook_manager.register(DownloadHooks())
+    hook_manager.hook.before_pipeline_run(
+        run_params={}, pipeline=download_pipeline, catalog=catalog
+    )
+    prefetched.clear()
+    IncrementalRunner().run(download_pipeline, catalog, hook_manager)
+
+
+def test_incremental_runner_reruns_changed_download_node(
+    runner_project, params, monkeypatch, caplog
+):
+    bootstrap_project(PROJECT_PATH)
+    prefetched = []
+    prefetch = nodes.prefetch
+    monkeypatch.setattr(
+        nodes,
+        'prefetch',
+        lambda params, names: prefetched.append(names) or prefetch(params, names),
+    )
+    download_pipeline = pipelines['__default__'].only_nodes(
+        'download_ecoli_data_node', 'download_glass_data_node'
+    )
+    _run_incremental(download_pipeline, params, prefetched)
+    assert sorted(prefetched[0]) == ['ecoli', 'glass']
+    # The node that ran first prefetched the files of both nodes.
+    changed = download_pipeline.nodes[-1]
+    name = changed.outputs[0].removesuffix('_data')
+    urls_params = params['numerical_features_binary_target_imbalanced_data_urls']
+    urls_params[name] = f'{urls_params[name]}?v=2'
+    caplog.clear()
+    with caplog.at_level('INFO', logger='kedro.runner'):
+        _run_incremental(download_pipeline, params, prefetched)
+    skipped = [
+        record.args[0]
+        for record in caplog.records
+        if record.msg == 'Skipped up-to-date node: %s'
+    ]
+    assert skipped == [download_pipeline.nodes[0].name]
+    assert prefetched == [[name]]
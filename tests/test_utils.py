@@ -0,0 +1,41 @@
+import io
+
+import numpy as np
+import pandas as pd
+from ial_datasets.readers import read_arff
+from ial_datasets.utils import transform_numeric_features_binary_target
+
+KEEL_DATA = b'''@relation test
+@attribute Age integer[1,90]
+@attribute Weight real [1.0, 200.0]
+@attribute Class {positive, negative}
+@inputs Age, Weight
+@outputs Class
+@data
+25, 70.5, positive
+?, 80.0, negative
+40, <null>, negative
+33, 65.0, negative
+'''
+
+
+def test_transform_drops_rows_with_missing_integer_values():
+    data = read_arff(io.BytesIO(KEEL_DATA))
+    assert data['Age'].dtype == 'Int64'
+    assert data['Weight'].dtype == 'float64'
+    assert data['Class'].dtype == 'category'
+    result = transform_numeric_features_binary_target(
+        data, target_vals=['positive'], dtypes={'features': 'float32'}
+    )
+    expected = pd.DataFrame(
+        np.array([[25.0, 70.5], [33.0, 65.0]], dtype='float32'), index=[0, 3]
+    )
+    expected['target'] = np.array([1, 0])
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_transform_without_features():
+    data = pd.DataFrame({'id': [1, 2], 'class': [1, 0]})
+    result = transform_numeric_features_binary_target(data, drop_cols=['id'])
+    assert result.shape == (2, 1)
+    assert result['target'].tolist() == [1, 0]